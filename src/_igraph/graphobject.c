@@ -1239,6 +1239,24 @@ PyObject *igraphmodule_Graph_is_mutual(igraphmodule_GraphObject *self,
   return list;
 }
 
+/** \ingroup python_interface_graph
+ * \brief Checks whether an \c igraph.Graph object has loop edges.
+ * \return \c True if the graph has loop edges, \c False otherwise.
+ * \sa igraph_has_loop
+ */
+PyObject *igraphmodule_Graph_has_loop(igraphmodule_GraphObject* self, PyObject* Py_UNUSED(_null)) {
+  igraph_bool_t res;
+
+  if (igraph_has_loop(&self->g, &res)) {
+    igraphmodule_handle_igraph_error();
+    return NULL;
+  }
+
+  if (res)
+    Py_RETURN_TRUE;
+  Py_RETURN_FALSE;
+}
+
 /** \ingroup python_interface_graph
  * \brief Checks whether an \c igraph.Graph object has multiple edges.
  * \return \c True if the graph has multiple edges, \c False otherwise.
@@ -4981,6 +4999,33 @@ PyObject *igraphmodule_Graph_connected_components(
   return list;
 }
 
+/** \ingroup python_interface_graph
+ * \brief Counts the (weakly or strongly) connected components in a graph.
+ * \return the number of components
+ * \sa igraph_connected_components
+ */
+PyObject *igraphmodule_Graph_connected_components_count(
+  igraphmodule_GraphObject * self, PyObject * args, PyObject * kwds
+) {
+  static char *kwlist[] = { "mode", NULL };
+  igraph_connectedness_t mode = IGRAPH_STRONG;
+  igraph_integer_t no;
+  PyObject *mode_o = Py_None;
+
+  if (!PyArg_ParseTupleAndKeywords(args, kwds, "|O", kwlist, &mode_o))
+    return NULL;
+
+  if (igraphmodule_PyObject_to_connectedness_t(mode_o, &mode))
+    return NULL;
+
+  if (igraph_connected_components(&self->g, NULL, NULL, &no, mode)) {
+    igraphmodule_handle_igraph_error();
+    return NULL;
+  }
+
+  return igraphmodule_integer_t_to_PyObject(no);
+}
+
 /** \ingroup python_interface_graph
  * \brief Calculates Burt's constraint scores for a given graph
  * \sa igraph_constraint
@@ -13994,6 +14039,15 @@ struct PyMethodDef igraphmodule_Graph_methods[] = {
    "  edges are checked.\n"
    "@return: a list of booleans, one for every edge given\n"},
 
+  /* interface to igraph_has_loop */
+  {"has_loop", (PyCFunction) igraphmodule_Graph_has_loop,
+   METH_NOARGS,
+   "has_loop()\n--\n\n"
+   "Checks whether the graph has loop edges.\n\n"
+   "@return: C{True} if the graph has at least one loop edge,\n"
+   "         C{False} otherwise.\n"
+   "@rtype: boolean"},
+
   /* interface to igraph_is_multiple */
   {"is_multiple", (PyCFunction) igraphmodule_Graph_is_multiple,
    METH_VARARGS | METH_KEYWORDS,
@@ -15201,6 +15255,16 @@ struct PyMethodDef igraphmodule_Graph_methods[] = {
    "@param mode: must be either C{\"strong\"} or C{\"weak\"}, depending on\n"
    "  the clusters being sought. Optional, defaults to C{\"strong\"}.\n"
    "@return: the component index for every node in the graph.\n"},
+  {"connected_components_count",
+   (PyCFunction) igraphmodule_Graph_connected_components_count,
+   METH_VARARGS | METH_KEYWORDS,
+   "connected_components_count(mode=\"strong\")\n--\n\n"
+   "Counts the (strong or weak) connected components of the graph.\n\n"
+   "This is faster than calculating the components themselves with\n"
+   "L{Graph.connected_components()} when only their number is needed.\n"
+   "@param mode: must be either C{\"strong\"} or C{\"weak\"}, depending on\n"
+   "  the clusters being sought. Optional, defaults to C{\"strong\"}.\n"
+   "@return: the number of connected components.\n"},
   {"copy", (PyCFunction) igraphmodule_Graph_copy,
    METH_NOARGS,
    "copy()\n--\n\n"
@@ -17121,7 +17185,9 @@ struct PyMethodDef igraphmodule_Graph_methods[] = {
    "  in the Laplacian matrix. C{\"all\"} means that the edge directions must be\n"
    "  ignored, C{\"out\"} means that the out-degrees should be used, C{\"in\"}\n"
    "  means that the in-degrees should be used. Ignored for undirected graphs.\n"
-   "@return: the Laplacian matrix.\n"},
+   "@return: the Laplacian matrix as a list of lists.\n"
+   "@see: Graph.get_laplacian_sparse() for a SciPy sparse matrix that avoids\n"
+   "  creating a Python float for every cell of the matrix\n\n"},
 
   ///////////////////////////////
   // LOADING AND SAVING GRAPHS //
@@ -81,6 +81,7 @@ from igraph.adjacency import (
     _get_adjlist,
     _get_biadjacency,
     _get_inclist,
+    _get_laplacian_sparse,
 )
 from igraph.automorphisms import (
     _count_automorphisms_vf2,
@@ -623,6 +624,7 @@ class Graph(GraphBase):
     get_adjlist = _get_adjlist
     get_biadjacency = _get_biadjacency
     get_inclist = _get_inclist
+    get_laplacian_sparse = _get_laplacian_sparse
 
     #############################################
     # Structural properties
@@ -1126,6 +1128,7 @@ del (
     _get_adjacency,
     _get_adjacency_sparse,
     _get_adjlist,
+    _get_laplacian_sparse,
     _maximum_bipartite_matching,
     _bipartite_projection,
     _bipartite_projection_size,
@@ -1,7 +1,10 @@
 from igraph._igraph import (
+    ALL,
     GET_ADJACENCY_BOTH,
     GET_ADJACENCY_LOWER,
     GET_ADJACENCY_UPPER,
+    IN,
+    OUT,
     GraphBase,
 )
 from igraph.datatypes import Matrix
@@ -13,6 +16,7 @@ __all__ = (
     "_get_adjlist",
     "_get_biadjacency",
     "_get_inclist",
+    "_get_laplacian_sparse",
 )
 
 
@@ -120,6 +124,117 @@ def _get_adjacency_sparse(self, attribute=None):
     return mtx
 
 
+def _get_laplacian_sparse(self, weights=None, normalized="unnormalized", mode="out"):
+    """Returns the Laplacian matrix of a graph as a SciPy CSR matrix.
+
+    This is the sparse counterpart of L{Graph.laplacian()}; the matrix is
+    assembled directly from the edge list, so it needs memory proportional to
+    the number of edges instead of the square of the number of vertices.
+
+    @param weights: edge weights to be used. Can be a sequence or iterable or
+      even an edge attribute name. When edge weights are used, the degree
+      of a node is considered to be the sum of the weights of its incident
+      edges.
+    @param normalized: whether to return the normalized Laplacian matrix.
+      C{False} or C{"unnormalized"} returns the unnormalized Laplacian matrix.
+      C{True} or C{"symmetric"} returns the symmetric normalization of the
+      Laplacian matrix. C{"left"} returns the left-, C{"right"} returns the
+      right-normalized Laplacian matrix.
+    @param mode: for directed graphs, specifies whether to use out- or in-degrees
+      in the Laplacian matrix. C{"all"} means that the edge directions must be
+      ignored, C{"out"} means that the out-degrees should be used, C{"in"}
+      means that the in-degrees should be used. Ignored for undirected graphs.
+    @return: the Laplacian matrix as a C{scipy.sparse.csr_matrix}.
+    """
+    try:
+        import numpy as np
+        from scipy import sparse
+    except ImportError:
+        raise ImportError(
+            "You should install scipy in order to use this function"
+        ) from None
+
+    # String arguments are case-insensitive, just like in Graph.laplacian()
+    if isinstance(normalized, str):
+        normalized = normalized.lower()
+    if isinstance(mode, str):
+        mode = mode.lower()
+
+    if normalized is True:
+        normalized = "symmetric"
+    elif normalized is False:
+        normalized = "unnormalized"
+    elif normalized not in ("unnormalized", "symmetric", "left", "right"):
+        raise ValueError(f"invalid Laplacian normalization: {normalized!r}")
+
+    mode = {OUT: "out", IN: "in", ALL: "all"}.get(mode, mode)
+    if mode not in ("out", "in", "all"):
+        raise ValueError(f"invalid mode: {mode!r}")
+
+    num_vertices, num_edges = self.vcount(), self.ecount()
+    if isinstance(weights, str):
+        weights = self.es[weights]
+    if weights is None:
+        weights = np.ones(num_edges)
+    else:
+        weights = np.asarray(weights, dtype=float)
+        if weights.shape != (num_edges,):
+            raise ValueError("weight vector length must match the number of edges")
+        if num_edges > 0 and not weights.min() >= 0:
+            raise ValueError("weight vector must be non-negative and not NaN")
+
+    degrees = np.asarray(
+        self.strength(mode=mode, loops=True, weights=weights.tolist()), dtype=float
+    )
+    edges = np.asarray(self.get_edgelist(), dtype=np.intp).reshape(num_edges, 2)
+    sources, targets = edges[:, 0], edges[:, 1]
+    symmetric = not self.is_directed() or mode == "all"
+
+    # Compute the diagonal and the weights of the (from, to) and, in the
+    # symmetric case, the (to, from) entries of each edge
+    if normalized == "unnormalized":
+        diagonal = degrees
+        forward = backward = weights
+    else:
+        nonzero = degrees > 0
+        diagonal = nonzero.astype(float)
+        scale = np.zeros(num_vertices)
+        if normalized == "symmetric":
+            scale[nonzero] = 1.0 / np.sqrt(degrees[nonzero])
+            norm = scale[sources] * scale[targets]
+            forward = backward = weights * norm
+        elif normalized == "left":
+            scale[nonzero] = 1.0 / degrees[nonzero]
+            norm = scale[sources]
+            forward, backward = weights * norm, weights * scale[targets]
+        else:
+            scale[nonzero] = 1.0 / degrees[nonzero]
+            norm = scale[targets]
+            forward, backward = weights * norm, weights * scale[sources]
+
+        if np.any((norm == 0) & (weights != 0)):
+            raise ValueError(
+                "found non-isolated vertex with zero degree or strength, cannot "
+                f"perform {normalized} normalization of the Laplacian in "
+                f"{mode!r} mode"
+            )
+
+    vertices = np.arange(num_vertices)
+    if symmetric:
+        rows = np.concatenate((vertices, sources, targets))
+        cols = np.concatenate((vertices, targets, sources))
+        data = np.concatenate((diagonal, -forward, -backward))
+    else:
+        rows = np.concatenate((vertices, sources))
+        cols = np.concatenate((vertices, targets))
+        data = np.concatenate((diagonal, -forward))
+
+    # Duplicate entries of multi-edges and loops are summed up here
+    mtx = sparse.csr_matrix((data, (rows, cols)), shape=(num_vertices, num_vertices))
+    mtx.eliminate_zeros()
+    return mtx
+
+
 def _get_adjlist(self, mode="out"):
     """Returns the adjacency list representation of the graph.
 
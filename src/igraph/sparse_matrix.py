@@ -80,10 +80,8 @@ def _graph_from_sparse_matrix(klass, matrix, mode="directed", loops="once"):
     """
     # This function assumes there is scipy and the matrix is a scipy sparse
     # matrix. The caller should make sure those conditions are met.
-    from scipy import sparse
-
-    if not isinstance(matrix, sparse.coo_matrix):
-        matrix = matrix.tocoo()
+    # tocoo() returns COO matrices and arrays as is, without copying them.
+    matrix = matrix.tocoo()
 
     nvert = max(matrix.shape)
     if min(matrix.shape) != nvert:
@@ -167,10 +165,8 @@ def _graph_from_weighted_sparse_matrix(
     """
     # This function assumes there is scipy and the matrix is a scipy sparse
     # matrix. The caller should make sure those conditions are met.
-    from scipy import sparse
-
-    if not isinstance(matrix, sparse.coo_matrix):
-        matrix = matrix.tocoo()
+    # tocoo() returns COO matrices and arrays as is, without copying them.
+    matrix = matrix.tocoo()
 
     nvert = max(matrix.shape)
     if min(matrix.shape) != nvert:
@@ -35,9 +35,9 @@ class AtlasTestBase:
     def testEigenvectorCentrality(self):
         # Temporarily turn off the warning handler because g.evcent() will print
         # a warning for DAGs
-        warnings.simplefilter("ignore")
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
 
-        try:
             for idx, g in enumerate(self.__class__.graphs):
                 try:
                     ec, eval = g.evcent(return_eigenvalue=True)
@@ -93,9 +93,6 @@ class AtlasTestBase:
                         msg="Eigenvector centrality in graph #%d seems to be invalid "
                         "for vertex %d" % (idx, i),
                     )
-        finally:
-            # Reset the warning handler
-            warnings.resetwarnings()
 
     def testHubScore(self):
         for idx, g in enumerate(self.__class__.graphs):
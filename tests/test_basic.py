@@ -362,12 +362,16 @@ class BasicTests(unittest.TestCase):
     def testMultiplesLoops(self):
         g = Graph.Tree(7, 2)
 
-        # has_multiple
+        # has_multiple, has_loop
         self.assertFalse(g.has_multiple())
+        self.assertFalse(g.has_loop())
 
         g.add_vertices(1)
         g.add_edges([(0, 1), (7, 7), (6, 6), (6, 6), (6, 6)])
 
+        # has_loop
+        self.assertTrue(g.has_loop())
+
         # is_loop
         self.assertTrue(
             g.is_loop()
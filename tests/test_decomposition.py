@@ -67,6 +67,17 @@ class DecompositionTests(unittest.TestCase):
         for component in components:
             assert component.isomorphic(g1)
 
+    def testConnectedComponentsCount(self):
+        g = Graph.Full(5) + Graph.Full(3) + Graph(2)
+        self.assertEqual(g.connected_components_count(), 4)
+        self.assertEqual(g.connected_components_count(), len(g.connected_components()))
+
+        g = Graph([(0, 1), (1, 2), (2, 0), (2, 3)], directed=True)
+        self.assertEqual(g.connected_components_count(), 2)
+        self.assertEqual(g.connected_components_count("weak"), 1)
+
+        self.assertEqual(Graph().connected_components_count(), 0)
+
     def testKCores(self):
         g = Graph(
             11,
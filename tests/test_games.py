@@ -1,9 +1,13 @@
+import random
 import unittest
 
 from igraph import Graph, InternalError, Layout
 
 
 class GameTests(unittest.TestCase):
+    # Expected vertex types of Graph.Random_Bipartite(10, 20, ...)
+    RANDOM_BIPARTITE_TYPES = [False] * 10 + [True] * 20
+
     def testGRG(self):
         g = Graph.GRG(50, 0.2)
         self.assertTrue(isinstance(g, Graph))
@@ -26,33 +30,27 @@ class GameTests(unittest.TestCase):
     def testPreference(self):
         g = Graph.Preference(100, [1, 1], [[1, 0], [0, 1]])
         self.assertTrue(isinstance(g, Graph))
-        self.assertEqual(len(g.connected_components()), 2)
+        self.assertEqual(g.connected_components_count(), 2)
 
         g = Graph.Preference(100, [1, 1], [[1, 0], [0, 1]], attribute="type")
         types = g.vs.get_attribute_values("type")
-        self.assertTrue(min(types) == 0 and max(types) == 1)
+        self.assertEqual(set(types), {0, 1})
 
     def testAsymmetricPreference(self):
         g = Graph.Asymmetric_Preference(100, [[0, 1], [1, 0]], [[0, 1], [1, 0]])
         self.assertTrue(isinstance(g, Graph))
-        self.assertEqual(len(g.connected_components()), 2)
+        self.assertEqual(g.connected_components_count(), 2)
 
         g = Graph.Asymmetric_Preference(
             100, [[0, 1], [1, 0]], [[1, 0], [0, 1]], attribute="type"
         )
-        types = g.vs.get_attribute_values("type")
-        types1 = [i[0] for i in types]
-        types2 = [i[1] for i in types]
-        self.assertTrue(
-            min(types1) == 0
-            and max(types1) == 1
-            and min(types2) == 0
-            and max(types2) == 1
-        )
+        types1, types2 = zip(*g.vs.get_attribute_values("type"))
+        self.assertEqual(set(types1), {0, 1})
+        self.assertEqual(set(types2), {0, 1})
 
         g = Graph.Asymmetric_Preference(100, [[0, 1], [1, 0]], [[1, 0], [0, 1]])
         self.assertTrue(isinstance(g, Graph))
-        self.assertEqual(len(g.connected_components()), 1)
+        self.assertEqual(g.connected_components_count(), 1)
 
     def testTreeGame(self):
         # Prufer algorithm
@@ -86,75 +84,53 @@ class GameTests(unittest.TestCase):
         g = Graph.Watts_Strogatz(1, 20, 1, 0.2)
         self.assertTrue(isinstance(g, Graph) and g.vcount() == 20 and g.ecount() == 20)
 
-    def testRandomBipartiteNP(self):
-        # Test np mode, undirected
-        g = Graph.Random_Bipartite(10, 20, p=0.25)
-        self.assertTrue(g.is_simple())
-        self.assertTrue(g.is_bipartite())
-        self.assertFalse(g.is_directed())
-        self.assertEqual([False] * 10 + [True] * 20, g.vs["type"])
-
-        # Test np mode, directed, "out"
-        g = Graph.Random_Bipartite(10, 20, p=0.25, directed=True, neimode="out")
-        self.assertTrue(g.is_simple())
-        self.assertTrue(g.is_bipartite())
-        self.assertTrue(g.is_directed())
-        self.assertEqual([False] * 10 + [True] * 20, g.vs["type"])
-        self.assertTrue(all(g.vs[e.tuple]["type"] == [False, True] for e in g.es))
-
-        # Test np mode, directed, "in"
-        g = Graph.Random_Bipartite(10, 20, p=0.25, directed=True, neimode="in")
-        self.assertTrue(g.is_simple())
-        self.assertTrue(g.is_bipartite())
-        self.assertTrue(g.is_directed())
-        self.assertEqual([False] * 10 + [True] * 20, g.vs["type"])
-        self.assertTrue(all(g.vs[e.tuple]["type"] == [True, False] for e in g.es))
+    def _testRandomBipartite(self, **kwds):
+        cases = [
+            # directed, neimode, expected types of the endpoints of each edge
+            (False, "all", None),
+            (True, "out", [False, True]),
+            (True, "in", [True, False]),
+            (True, "all", None),
+        ]
+        for directed, neimode, endpoint_types in cases:
+            with self.subTest(directed=directed, neimode=neimode):
+                g = Graph.Random_Bipartite(
+                    10, 20, directed=directed, neimode=neimode, **kwds
+                )
+                self.assertTrue(g.is_simple())
+                self.assertTrue(g.is_bipartite())
+                self.assertEqual(directed, g.is_directed())
+                if "m" in kwds:
+                    self.assertEqual(kwds["m"], g.ecount())
+                self.assertEqual(self.RANDOM_BIPARTITE_TYPES, g.vs["type"])
+                if endpoint_types is not None:
+                    self.assertEndpointTypes(g, *endpoint_types)
+
+    def assertEndpointTypes(self, g, source_type, target_type):
+        """Asserts that every edge of the given bipartite graph points from a
+        vertex of the given source type to a vertex of the given target type."""
+        types = g.vs["type"]
+        self.assertTrue(
+            all(
+                types[s] == source_type and types[t] == target_type
+                for s, t in g.get_edgelist()
+            )
+        )
 
-        # Test np mode, directed, "all"
-        g = Graph.Random_Bipartite(10, 20, p=0.25, directed=True, neimode="all")
-        self.assertTrue(g.is_simple())
-        self.assertTrue(g.is_bipartite())
-        self.assertTrue(g.is_directed())
-        self.assertEqual([False] * 10 + [True] * 20, g.vs["type"])
+    def testRandomBipartiteNP(self):
+        self._testRandomBipartite(p=0.25)
 
     def testRandomBipartiteNM(self):
-        # Test np mode, undirected
-        g = Graph.Random_Bipartite(10, 20, m=50)
-        self.assertTrue(g.is_simple())
-        self.assertTrue(g.is_bipartite())
-        self.assertFalse(g.is_directed())
-        self.assertEqual(50, g.ecount())
-        self.assertEqual([False] * 10 + [True] * 20, g.vs["type"])
-
-        # Test np mode, directed, "out"
-        g = Graph.Random_Bipartite(10, 20, m=50, directed=True, neimode="out")
-        self.assertTrue(g.is_simple())
-        self.assertTrue(g.is_bipartite())
-        self.assertTrue(g.is_directed())
-        self.assertEqual(50, g.ecount())
-        self.assertEqual([False] * 10 + [True] * 20, g.vs["type"])
-        self.assertTrue(all(g.vs[e.tuple]["type"] == [False, True] for e in g.es))
-
-        # Test np mode, directed, "in"
-        g = Graph.Random_Bipartite(10, 20, m=50, directed=True, neimode="in")
-        self.assertTrue(g.is_simple())
-        self.assertTrue(g.is_bipartite())
-        self.assertTrue(g.is_directed())
-        self.assertEqual(50, g.ecount())
-        self.assertEqual([False] * 10 + [True] * 20, g.vs["type"])
-        self.assertTrue(all(g.vs[e.tuple]["type"] == [True, False] for e in g.es))
-
-        # Test np mode, directed, "all"
-        g = Graph.Random_Bipartite(10, 20, m=50, directed=True, neimode="all")
-        self.assertTrue(g.is_simple())
-        self.assertTrue(g.is_bipartite())
-        self.assertTrue(g.is_directed())
-        self.assertEqual(50, g.ecount())
-        self.assertEqual([False] * 10 + [True] * 20, g.vs["type"])
+        self._testRandomBipartite(m=50)
 
     def testRewire(self):
+        # Generate the random geometric graph only once, with a fixed seed;
+        # each subcase below rewires its own copy of it
+        random.seed(0)
+        g_base = Graph.GRG(25, 0.4)
+
         # Undirected graph
-        g = Graph.GRG(25, 0.4)
+        g = g_base.copy()
         degrees = g.degree()
 
         # Rewiring without loops
@@ -165,7 +141,7 @@ class GameTests(unittest.TestCase):
         # Rewiring with loops (1)
         g.rewire(10000, mode="loops")
         self.assertEqual(degrees, g.degree())
-        self.assertFalse(any(g.is_multiple()))
+        self.assertFalse(g.has_multiple())
 
         # Rewiring with loops (2)
         g = Graph.Full(4)
@@ -173,10 +149,10 @@ class GameTests(unittest.TestCase):
         degrees = g.degree()
         g.rewire(100, mode="loops")
         self.assertEqual(degrees, g.degree())
-        self.assertFalse(any(g.is_multiple()))
+        self.assertFalse(g.has_multiple())
 
         # Directed graph
-        g = Graph.GRG(25, 0.4)
+        g = g_base.copy()
         g.to_directed("mutual")
         indeg, outdeg = g.indegree(), g.outdegree()
         g.rewire(10000)
@@ -188,7 +164,7 @@ class GameTests(unittest.TestCase):
         g.rewire(10000, mode="loops")
         self.assertEqual(indeg, g.indegree())
         self.assertEqual(outdeg, g.outdegree())
-        self.assertFalse(any(g.is_multiple()))
+        self.assertFalse(g.has_multiple())
 
 
 def suite():
@@ -4,14 +4,19 @@ from igraph import Graph
 
 
 class IteratorTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # The traversals below do not modify the graph so it can be shared
+        cls.tree = Graph.Tree(10, 2)
+
     def testBFS(self):
-        g = Graph.Tree(10, 2)
+        g = self.tree
         vs, layers, ps = g.bfs(0)
         self.assertEqual(vs, [0, 1, 2, 3, 4, 5, 6, 7, 8, 9])
         self.assertEqual(ps, [-1, 0, 0, 1, 1, 2, 2, 3, 3, 4])
 
     def testBFSIter(self):
-        g = Graph.Tree(10, 2)
+        g = self.tree
         vs = [v.index for v in g.bfsiter(0)]
         self.assertEqual(vs, [0, 1, 2, 3, 4, 5, 6, 7, 8, 9])
         vs = [(v.index, d, p) for v, d, p in g.bfsiter(0, advanced=True)]
@@ -32,13 +37,13 @@ class IteratorTests(unittest.TestCase):
         )
 
     def testDFS(self):
-        g = Graph.Tree(10, 2)
+        g = self.tree
         vs, ps = g.dfs(0)
         self.assertEqual(vs, [0, 2, 6, 5, 1, 4, 9, 3, 8, 7])
         self.assertEqual(ps, [-1, 0, 2, 2, 0, 1, 4, 1, 3, 3])
 
     def testDFSIter(self):
-        g = Graph.Tree(10, 2)
+        g = self.tree
         vs = [v.index for v in g.dfsiter(0)]
         self.assertEqual(vs, [0, 1, 3, 7, 8, 4, 9, 2, 5, 6])
         vs = [(v.index, d, p) for v, d, p in g.dfsiter(0, advanced=True)]
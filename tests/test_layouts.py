@@ -1,9 +1,62 @@
+import random
 import unittest
 from math import hypot
 from igraph import Graph, Layout, BoundingBox, InternalError
 from igraph import umap_compute_weights
 
 
+# Graph with two articulation points and the edge distances for the UMAP test;
+# the distances make the two 4-cliques at the ends form separate clusters
+UMAP_EDGES = (
+    (0, 1),
+    (0, 2),
+    (0, 3),
+    (1, 2),
+    (1, 3),
+    (2, 3),
+    (3, 4),
+    (4, 5),
+    (5, 6),
+    (6, 7),
+    (7, 8),
+    (6, 8),
+    (7, 9),
+    (6, 9),
+    (8, 9),
+    (7, 10),
+    (8, 10),
+    (9, 10),
+    (10, 11),
+    (9, 11),
+    (8, 11),
+    (7, 11),
+)
+UMAP_DISTANCES = (
+    0.1,
+    0.09,
+    0.12,
+    0.09,
+    0.1,
+    0.1,
+    0.9,
+    0.9,
+    0.9,
+    0.2,
+    0.1,
+    0.1,
+    0.1,
+    0.1,
+    0.1,
+    0.08,
+    0.05,
+    0.1,
+    0.08,
+    0.12,
+    0.09,
+    0.11,
+)
+
+
 class LayoutTests(unittest.TestCase):
     def testConstructor(self):
         layout = Layout([(0, 0, 1), (0, 1, 0), (1, 0, 0)])
@@ -111,9 +164,11 @@ class LayoutTests(unittest.TestCase):
         layout = Layout([(0, 0), (-1, 1), (0, 1), (1, 1)])
         layout.to_radial(min_angle=180, max_angle=0, max_radius=2)
         exp = [[0.0, 0.0], [-2.0, 0.0], [0.0, 2.0], [2, 0.0]]
-        for idx in range(4):
-            self.assertAlmostEqual(layout.coords[idx][0], exp[idx][0], places=3)
-            self.assertAlmostEqual(layout.coords[idx][1], exp[idx][1], places=3)
+        coords = layout.coords
+        self.assertEqual(len(coords), len(exp))
+        for (x, y), (exp_x, exp_y) in zip(coords, exp):
+            self.assertAlmostEqual(x, exp_x, places=3)
+            self.assertAlmostEqual(y, exp_y, places=3)
 
     def testTransform(self):
         def tr(coord, dx, dy):
@@ -125,6 +180,25 @@ class LayoutTests(unittest.TestCase):
 
 
 class LayoutAlgorithmTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Seeded random graphs that the layout tests below share; tests that
+        # need to modify them work on a copy
+        random.seed(0)
+        cls.ba100 = Graph.Barabasi(100)
+        cls.ba100_plus_50 = cls.ba100 + Graph.Barabasi(50)
+        cls.tree = Graph.Tree(10, 2)
+        cls.tree_distances = cls.tree.distances()
+
+        # Per-vertex coordinate bounds for the layouts of the 100-vertex graph
+        cls.range100 = list(range(100))
+        cls.box_bounds100 = {
+            "miny": [2] * 100,
+            "maxy": [3] * 100,
+            "minx": [4] * 100,
+            "maxx": [6] * 100,
+        }
+
     def testAuto(self):
         def layout_test(graph, test_with_dims=(2, 3)):
             lo = graph.layout("auto")
@@ -181,38 +255,36 @@ class LayoutAlgorithmTests(unittest.TestCase):
 
         g = Graph.Ring(8)
         layout = g.layout("circle")
-        test_is_proper_circular_layout(g, g.layout("circle"))
+        test_is_proper_circular_layout(g, layout)
 
         order = [0, 2, 4, 6, 1, 3, 5, 7]
         ordered_layout = g.layout("circle", order=order)
-        test_is_proper_circular_layout(g, g.layout("circle"))
+        test_is_proper_circular_layout(g, ordered_layout)
         for v, w in enumerate(order):
             self.assertAlmostEqual(layout[v][0], ordered_layout[w][0])
             self.assertAlmostEqual(layout[v][1], ordered_layout[w][1])
 
     def testDavidsonHarel(self):
         # Quick smoke testing only
-        g = Graph.Barabasi(100)
+        g = self.ba100
         lo = g.layout("dh")
         self.assertTrue(isinstance(lo, Layout))
 
     def testFruchtermanReingold(self):
-        g = Graph.Barabasi(100)
+        g = self.ba100
 
         lo = g.layout("fr")
         self.assertTrue(isinstance(lo, Layout))
 
-        lo = g.layout("fr", miny=list(range(100)))
+        lo = g.layout("fr", miny=self.range100)
         self.assertTrue(isinstance(lo, Layout))
-        self.assertTrue(all(lo[i][1] >= i for i in range(100)))
+        self.assertTrue(all(y >= i for i, (_, y) in enumerate(lo)))
 
-        lo = g.layout("fr", miny=list(range(100)), maxy=list(range(100)))
+        lo = g.layout("fr", miny=self.range100, maxy=self.range100)
         self.assertTrue(isinstance(lo, Layout))
-        self.assertTrue(all(lo[i][1] == i for i in range(100)))
+        self.assertTrue(all(y == i for i, (_, y) in enumerate(lo)))
 
-        lo = g.layout(
-            "fr", miny=[2] * 100, maxy=[3] * 100, minx=[4] * 100, maxx=[6] * 100
-        )
+        lo = g.layout("fr", **self.box_bounds100)
         self.assertTrue(isinstance(lo, Layout))
         bbox = lo.bounding_box()
         self.assertTrue(bbox.top >= 2)
@@ -221,18 +293,17 @@ class LayoutAlgorithmTests(unittest.TestCase):
         self.assertTrue(bbox.right <= 6)
 
     def testFruchtermanReingoldGrid(self):
-        g = Graph.Barabasi(100)
+        g, miny = self.ba100, self.range100
         for grid_opt in ["grid", "nogrid", "auto", True, False]:
-            lo = g.layout("fr", miny=list(range(100)), grid=grid_opt)
-            self.assertTrue(isinstance(lo, Layout))
-            self.assertTrue(all(lo[i][1] >= i for i in range(100)))
+            with self.subTest(grid=grid_opt):
+                lo = g.layout("fr", miny=miny, grid=grid_opt)
+                self.assertTrue(isinstance(lo, Layout))
+                self.assertTrue(all(y >= i for i, (_, y) in enumerate(lo)))
 
     def testKamadaKawai(self):
-        g = Graph.Barabasi(100)
+        g = self.ba100
 
-        lo = g.layout(
-            "kk", miny=[2] * 100, maxy=[3] * 100, minx=[4] * 100, maxx=[6] * 100
-        )
+        lo = g.layout("kk", **self.box_bounds100)
 
         self.assertTrue(isinstance(lo, Layout))
         bbox = lo.bounding_box()
@@ -241,10 +312,7 @@ class LayoutAlgorithmTests(unittest.TestCase):
         self.assertTrue(bbox.left >= 4)
         self.assertTrue(bbox.right <= 6)
 
-        lo = g.layout(
-            "kk", miny=[2] * 100, maxy=[3] * 100, minx=[4] * 100, maxx=[6] * 100,
-            weights=range(10, g.ecount() + 10)
-        )
+        lo = g.layout("kk", weights=range(10, g.ecount() + 10), **self.box_bounds100)
 
         self.assertTrue(isinstance(lo, Layout))
         bbox = lo.bounding_box()
@@ -254,15 +322,14 @@ class LayoutAlgorithmTests(unittest.TestCase):
         self.assertTrue(bbox.right <= 6)
 
     def testMDS(self):
-        g = Graph.Tree(10, 2)
+        g = self.tree
         lo = g.layout("mds")
         self.assertTrue(isinstance(lo, Layout))
 
-        dists = g.distances()
-        lo = g.layout("mds", dists)
+        lo = g.layout("mds", self.tree_distances)
         self.assertTrue(isinstance(lo, Layout))
 
-        g += Graph.Tree(10, 2)
+        g = self.tree + self.tree
         lo = g.layout("mds")
         self.assertTrue(isinstance(lo, Layout))
 
@@ -298,79 +365,8 @@ class LayoutAlgorithmTests(unittest.TestCase):
         self.assertEqual(lo.coords, [[0, 0]])
 
         # Graph with two articulation points
-        edges = [
-            0,
-            1,
-            0,
-            2,
-            0,
-            3,
-            1,
-            2,
-            1,
-            3,
-            2,
-            3,
-            3,
-            4,
-            4,
-            5,
-            5,
-            6,
-            6,
-            7,
-            7,
-            8,
-            6,
-            8,
-            7,
-            9,
-            6,
-            9,
-            8,
-            9,
-            7,
-            10,
-            8,
-            10,
-            9,
-            10,
-            10,
-            11,
-            9,
-            11,
-            8,
-            11,
-            7,
-            11,
-        ]
-        edges = list(zip(edges[::2], edges[1::2]))
-        dist = [
-            0.1,
-            0.09,
-            0.12,
-            0.09,
-            0.1,
-            0.1,
-            0.9,
-            0.9,
-            0.9,
-            0.2,
-            0.1,
-            0.1,
-            0.1,
-            0.1,
-            0.1,
-            0.08,
-            0.05,
-            0.1,
-            0.08,
-            0.12,
-            0.09,
-            0.11,
-        ]
-        g = Graph(edges)
-        lo = g.layout_umap(dist=dist, epochs=500)
+        g = Graph(UMAP_EDGES)
+        lo = g.layout_umap(dist=UMAP_DISTANCES, epochs=500)
         self.assertTrue(isinstance(lo, Layout))
 
         # One should get two clusters in this case
@@ -388,16 +384,15 @@ class LayoutAlgorithmTests(unittest.TestCase):
                 self.assertLess(dxy, 0.2 * distmax)
 
         # Test single epoch with seed
-        lo_adj = g.layout_umap(dist=dist, epochs=1, seed=lo)
+        lo_adj = g.layout_umap(dist=UMAP_DISTANCES, epochs=1, seed=lo)
         self.assertTrue(isinstance(lo_adj, Layout))
 
         # Same but inputting the coordinates
-        lo_adj = g.layout_umap(dist=dist, epochs=1, seed=lo.coords)
+        lo_adj = g.layout_umap(dist=UMAP_DISTANCES, epochs=1, seed=lo.coords)
         self.assertTrue(isinstance(lo_adj, Layout))
 
     def testUMAPComputeWeights(self):
-        edges = [0, 1, 0, 2, 1, 2, 1, 3, 2, 3, 2, 0]
-        edges = list(zip(edges[::2], edges[1::2]))
+        edges = [(0, 1), (0, 2), (1, 2), (1, 3), (2, 3), (2, 0)]
         dist = [1, 1.5, 1.8, 2.0, 3.4, 0.5]
         # NOTE: you need a directed graph to make sense of the symmetryzation
         g = Graph(edges, directed=True)
@@ -407,7 +402,7 @@ class LayoutAlgorithmTests(unittest.TestCase):
         )
 
     def testLGL(self):
-        g = Graph.Barabasi(100)
+        g = self.ba100
         lo = g.layout("lgl")
         self.assertTrue(isinstance(lo, Layout))
 
@@ -415,18 +410,19 @@ class LayoutAlgorithmTests(unittest.TestCase):
         self.assertTrue(isinstance(lo, Layout))
 
     def testReingoldTilford(self):
-        g = Graph.Barabasi(100)
+        g = self.ba100
         lo = g.layout("rt")
         ys = [coord[1] for coord in lo]
         root = ys.index(0.0)
         self.assertEqual(ys, g.distances(root)[0])
-        g = Graph.Barabasi(100) + Graph.Barabasi(50)
+        g = self.ba100_plus_50
         lo = g.layout("rt", root=[0, 100])
         self.assertEqual(lo[100][1] - lo[0][1], 0)
         lo = g.layout("rt", root=[0, 100], rootlevel=[2, 10])
         self.assertEqual(lo[100][1] - lo[0][1], 8)
 
-        # test named vertices
+        # test named vertices; work on a copy to keep the shared graph intact
+        g = g.copy()
         g.vs["name"] = [f"v{i}" for i in range(g.vcount())]
         lo = g.layout("rt", root=["v0", "v100"])
         self.assertEqual(lo[100][1] - lo[0][1], 0)
@@ -4,8 +4,13 @@ from igraph import Graph
 
 
 class MotifTests(unittest.TestCase):
-    def setUp(self):
-        self.g = Graph.Erdos_Renyi(100, 0.2, directed=True)
+    @classmethod
+    def setUpClass(cls):
+        # Small directed graph with mutual, asymmetric and null dyads; the
+        # census methods do not modify it so it can be shared
+        cls.g = Graph(
+            6, [(0, 1), (1, 0), (1, 2), (2, 3), (3, 1), (4, 5)], directed=True
+        )
 
     def testDyads(self):
         # @note: this test is not exhaustive, it only checks whether the
@@ -19,6 +24,7 @@ class MotifTests(unittest.TestCase):
         self.assertTrue(isinstance(tuple(dc), tuple))
         self.assertTrue(len(list(dc)) == 3)
         self.assertTrue(len(tuple(dc)) == 3)
+        self.assertEqual(tuple(dc), (1, 4, 10))
 
     def testTriads(self):
         # @note: this test is not exhaustive, it only checks whether the
@@ -32,11 +38,17 @@ class MotifTests(unittest.TestCase):
         self.assertTrue(isinstance(tuple(tc), tuple))
         self.assertTrue(len(list(tc)) == 16)
         self.assertTrue(len(tuple(tc)) == 16)
+        self.assertEqual(tuple(tc), (4, 11, 2, 0, 0, 0, 1, 1, 0, 1, 0, 0, 0, 0, 0, 0))
 
 
 class TrianglesTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Triangle-free graph that the tests below only read from
+        cls.petersen = Graph.Famous("petersen")
+
     def testListTriangles(self):
-        g = Graph.Famous("petersen")
+        g = self.petersen
         self.assertEqual([], g.list_triangles())
 
         g = Graph([(0, 1), (1, 2), (2, 0), (1, 3), (3, 2), (4, 2), (4, 3)])
@@ -46,10 +58,14 @@ class TrianglesTests(unittest.TestCase):
         expected = [[0, 1, 2], [1, 2, 3], [2, 3, 4]]
         self.assertEqual(observed, expected)
 
+        # Every triangle u < v < w is found exactly once from its edge (u, v)
+        # as a common neighbor w of u and v with w > v
         g = Graph.GRG(100, 0.2)
-        tri = Graph.Full(3)
         observed = sorted(sorted(tri) for tri in g.list_triangles())
-        expected = sorted(x for x in g.get_subisomorphisms_vf2(tri) if x == sorted(x))
+        neis = [set(adj) for adj in g.get_adjlist()]
+        expected = sorted(
+            [u, v, w] for u, v in g.get_edgelist() for w in neis[u] & neis[v] if w > v
+        )
         self.assertEqual(observed, expected)
 
 
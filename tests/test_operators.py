@@ -1,5 +1,7 @@
 import unittest
 
+from collections import Counter
+
 from igraph import Graph, disjoint_union, intersection, union
 
 try:
@@ -8,24 +10,74 @@ except ImportError:
     np = None
 
 
+# Two complete graphs on vertices 0-3 and 4-7, connected by two extra edges
+TWO_K4_EDGES = [
+    (0, 1),
+    (0, 2),
+    (0, 3),
+    (1, 2),
+    (1, 3),
+    (2, 3),
+    (4, 5),
+    (4, 6),
+    (4, 7),
+    (5, 6),
+    (5, 7),
+    (6, 7),
+    (0, 5),
+    (1, 4),
+]
+
+# Edges of the graph above after merging vertices 4 and 5 into 1 and 0
+CONTRACTED_TWO_K4_EDGES = [
+    (0, 0),
+    (0, 1),
+    (0, 1),
+    (0, 2),
+    (0, 3),
+    (0, 6),
+    (0, 7),
+    (1, 1),
+    (1, 2),
+    (1, 3),
+    (1, 6),
+    (1, 7),
+    (2, 3),
+    (6, 7),
+]
+
+
 class OperatorTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Shared operands of the operator tests; tests that modify them (e.g.,
+        # by adding attributes or vertices) work on copies
+        cls.tree = Graph.Tree(7, 2)
+        cls.lattice = Graph.Lattice([7])
+        cls.k3 = Graph.Full(3)
+        cls.k2 = Graph.Full(2)
+
+    def assertEdgelistEqual(self, g, expected):
+        """Asserts that the edge list of the given graph contains the same
+        edges as the expected list, with the same multiplicities but in any
+        order."""
+        self.assertEqual(g.ecount(), len(expected))
+        self.assertEqual(Counter(g.get_edgelist()), Counter(expected))
+
     def testComplementer(self):
-        g = Graph.Full(3)
+        g = self.k3
         g2 = g.complementer()
         self.assertTrue(g2.vcount() == 3 and g2.ecount() == 3)
-        self.assertTrue(sorted(g2.get_edgelist()) == [(0, 0), (1, 1), (2, 2)])
+        self.assertEdgelistEqual(g2, [(0, 0), (1, 1), (2, 2)])
 
-        g = Graph.Full(3) + Graph.Full(2)
+        g = self.k3 + self.k2
         g2 = g.complementer(False)
-        self.assertTrue(
-            sorted(g2.get_edgelist())
-            == [(0, 3), (0, 4), (1, 3), (1, 4), (2, 3), (2, 4)]
-        )
+        self.assertEdgelistEqual(g2, [(0, 3), (0, 4), (1, 3), (1, 4), (2, 3), (2, 4)])
 
         g2 = g.complementer(loops=True)
-        self.assertTrue(
-            sorted(g2.get_edgelist())
-            == [
+        self.assertEdgelistEqual(
+            g2,
+            [
                 (0, 0),
                 (0, 3),
                 (0, 4),
@@ -37,11 +89,11 @@ class OperatorTests(unittest.TestCase):
                 (2, 4),
                 (3, 3),
                 (4, 4),
-            ]
+            ],
         )
 
     def testMultiplication(self):
-        g = Graph.Full(3) * 3
+        g = self.k3 * 3
         self.assertTrue(
             g.vcount() == 9
             and g.ecount() == 9
@@ -49,25 +101,22 @@ class OperatorTests(unittest.TestCase):
         )
 
     def testDifference(self):
-        g = Graph.Tree(7, 2) - Graph.Lattice([7])
+        g = self.tree - self.lattice
         self.assertTrue(g.vcount() == 7 and g.ecount() == 5)
-        self.assertTrue(
-            sorted(g.get_edgelist()) == [(0, 2), (1, 3), (1, 4), (2, 5), (2, 6)]
-        )
+        self.assertEdgelistEqual(g, [(0, 2), (1, 3), (1, 4), (2, 5), (2, 6)])
 
     def testDifferenceWithSelfLoop(self):
         # https://github.com/igraph/igraph/issues/597#
         g = Graph.Ring(10) + [(0, 0)]
         g -= Graph.Ring(5)
         self.assertTrue(g.vcount() == 10 and g.ecount() == 7)
-        self.assertTrue(
-            sorted(g.get_edgelist())
-            == [(0, 0), (0, 9), (4, 5), (5, 6), (6, 7), (7, 8), (8, 9)]
+        self.assertEdgelistEqual(
+            g, [(0, 0), (0, 9), (4, 5), (5, 6), (6, 7), (7, 8), (8, 9)]
         )
 
     def testDisjointUnion(self):
-        g1 = Graph.Tree(7, 2)
-        g2 = Graph.Lattice([7])
+        g1 = self.tree
+        g2 = self.lattice
 
         # Method
         g = g1.disjoint_union(g2)
@@ -80,20 +129,23 @@ class OperatorTests(unittest.TestCase):
     def testDisjointUnionNoGraphs(self):
         self.assertRaises(ValueError, disjoint_union, [])
 
-    def testDisjointUnionSingle(self):
-        g1 = Graph.Tree(7, 2)
-        g = disjoint_union([g1])
-        self.assertTrue(g != g1)
-        self.assertTrue(g.vcount() == g1.vcount() and g.ecount() == g1.ecount())
-        self.assertTrue(g.is_directed() == g1.is_directed())
-        self.assertTrue(g.get_edgelist() == g1.get_edgelist())
+    def testSingleGraph(self):
+        # All set operators return a copy of the graph when given only one
+        g1 = self.tree
+        for func in (disjoint_union, union, intersection):
+            with self.subTest(func=func.__name__):
+                g = func([g1])
+                self.assertTrue(g != g1)
+                self.assertTrue(g.vcount() == g1.vcount() and g.ecount() == g1.ecount())
+                self.assertTrue(g.is_directed() == g1.is_directed())
+                self.assertTrue(g.get_edgelist() == g1.get_edgelist())
 
     def testUnion(self):
-        g = Graph.Tree(7, 2) | Graph.Lattice([7])
+        g = self.tree | self.lattice
         self.assertTrue(g.vcount() == 7 and g.ecount() == 12)
-        self.assertTrue(
-            sorted(g.get_edgelist())
-            == [
+        self.assertEdgelistEqual(
+            g,
+            [
                 (0, 1),
                 (0, 2),
                 (0, 6),
@@ -106,18 +158,18 @@ class OperatorTests(unittest.TestCase):
                 (3, 4),
                 (4, 5),
                 (5, 6),
-            ]
+            ],
         )
 
     def testUnionWithConflict(self):
-        g1 = Graph.Tree(7, 2)
+        g1 = self.tree.copy()
         g1["name"] = "Tree"
-        g2 = Graph.Lattice([7])
+        g2 = self.lattice.copy()
         g2["name"] = "Lattice"
         g = union([g1, g2])  # Issue 422
-        self.assertTrue(
-            sorted(g.get_edgelist())
-            == [
+        self.assertEdgelistEqual(
+            g,
+            [
                 (0, 1),
                 (0, 2),
                 (0, 6),
@@ -130,7 +182,7 @@ class OperatorTests(unittest.TestCase):
                 (3, 4),
                 (4, 5),
                 (5, 6),
-            ]
+            ],
         )
         self.assertTrue(
             sorted(g.attributes()),
@@ -138,22 +190,14 @@ class OperatorTests(unittest.TestCase):
         )
 
     def testUnionMethod(self):
-        g = Graph.Tree(7, 2).union(Graph.Lattice([7]))
+        g = self.tree.union(self.lattice)
         self.assertTrue(g.vcount() == 7 and g.ecount() == 12)
 
     def testUnionNoGraphs(self):
         self.assertRaises(ValueError, union, [])
 
-    def testUnionSingle(self):
-        g1 = Graph.Tree(7, 2)
-        g = union([g1])
-        self.assertTrue(g != g1)
-        self.assertTrue(g.vcount() == g1.vcount() and g.ecount() == g1.ecount())
-        self.assertTrue(g.is_directed() == g1.is_directed())
-        self.assertTrue(g.get_edgelist() == g1.get_edgelist())
-
     def testUnionMany(self):
-        gs = [Graph.Tree(7, 2), Graph.Lattice([7]), Graph.Lattice([7])]
+        gs = [self.tree, self.lattice, self.lattice]
         g = union(gs)
         self.assertTrue(g.vcount() == 7 and g.ecount() == 12)
 
@@ -168,10 +212,10 @@ class OperatorTests(unittest.TestCase):
         gs[1].vs[0]["attr"] = "set"
         gs[1].vs[0]["attr2"] = "conflict"
         g = union(gs)
-        names = g.vs["name"]
+        names, attrs = g.vs["name"], g.vs["attr"]
         self.assertTrue(g["attr"] == "graph1")
-        self.assertTrue(g.vs[names.index("A")]["attr"] == "set")
-        self.assertTrue(g.vs[names.index("B")]["attr"] == "set_too")
+        self.assertTrue(attrs[names.index("A")] == "set")
+        self.assertTrue(attrs[names.index("B")] == "set_too")
         self.assertTrue(g.ecount() == 2)
         self.assertTrue(
             sorted(g.vertex_attributes()) == ["attr", "attr2_1", "attr2_2", "name"]
@@ -185,49 +229,43 @@ class OperatorTests(unittest.TestCase):
         gs[0].es[0]["attr"] = "set"
         gs[1].es[0]["attr"] = "set_too"
         g = union(gs)
-        for e in g.es:
-            vnames = [g.vs[e.source]["name"], g.vs[e.target]["name"]]
-            if set(vnames) == {"A", "B"}:
-                self.assertTrue(e["attr"] == "set")
+        names = g.vs["name"]
+        # get_edgelist() lists the smaller endpoint first in undirected graphs
+        edge_ab = tuple(sorted((names.index("A"), names.index("B"))))
+        for edge, attr in zip(g.get_edgelist(), g.es["attr"]):
+            if edge == edge_ab:
+                self.assertTrue(attr == "set")
             else:
-                self.assertTrue(e["attr"] == "set_too")
+                self.assertTrue(attr == "set_too")
 
     def testIntersection(self):
-        g = Graph.Tree(7, 2) & Graph.Lattice([7])
+        g = self.tree & self.lattice
         self.assertTrue(g.get_edgelist() == [(0, 1)])
 
     def testIntersectionMethod(self):
-        g = Graph.Tree(7, 2).intersection(Graph.Lattice([7]))
+        g = self.tree.intersection(self.lattice)
         self.assertTrue(g.get_edgelist() == [(0, 1)])
 
     def testIntersectionNoGraphs(self):
         self.assertRaises(ValueError, intersection, [])
 
-    def testIntersectionSingle(self):
-        g1 = Graph.Tree(7, 2)
-        g = intersection([g1])
-        self.assertTrue(g != g1)
-        self.assertTrue(g.vcount() == g1.vcount() and g.ecount() == g1.ecount())
-        self.assertTrue(g.is_directed() == g1.is_directed())
-        self.assertTrue(g.get_edgelist() == g1.get_edgelist())
-
     def testIntersectionMany(self):
-        gs = [Graph.Tree(7, 2), Graph.Lattice([7])]
+        gs = [self.tree, self.lattice]
         g = intersection(gs)
         self.assertTrue(g.get_edgelist() == [(0, 1)])
 
     def testIntersectionManyAttributes(self):
-        gs = [Graph.Tree(7, 2), Graph.Lattice([7])]
+        gs = [self.tree.copy(), self.lattice.copy()]
         gs[0]["attr"] = "graph1"
         gs[0].vs["name"] = ["one", "two", "three", "four", "five", "six", "7"]
         gs[1].vs["name"] = ["one", "two", "three", "four", "five", "six", "7"]
         gs[0].vs[0]["attr"] = "set"
         gs[1].vs[5]["attr"] = "set_too"
         g = intersection(gs)
-        names = g.vs["name"]
+        names, attrs = g.vs["name"], g.vs["attr"]
         self.assertTrue(g["attr"] == "graph1")
-        self.assertTrue(g.vs[names.index("one")]["attr"] == "set")
-        self.assertTrue(g.vs[names.index("six")]["attr"] == "set_too")
+        self.assertTrue(attrs[names.index("one")] == "set")
+        self.assertTrue(attrs[names.index("six")] == "set_too")
         self.assertTrue(g.ecount() == 1)
         self.assertTrue(
             set(g.get_edgelist()[0]) == {names.index("one"), names.index("two")},
@@ -244,7 +282,7 @@ class OperatorTests(unittest.TestCase):
         self.assertTrue(g.es["attr"] == ["set"])
 
     def testInPlaceAddition(self):
-        g = Graph.Full(3)
+        g = self.k3.copy()
         orig = g
 
         # Adding vertices
@@ -291,7 +329,7 @@ class OperatorTests(unittest.TestCase):
         self.assertTrue(id(g) == id(orig))
 
         # Adding another graph
-        g += Graph.Full(3)
+        g += self.k3
         self.assertTrue(
             g.vcount() == 11
             and g.ecount() == 10
@@ -299,7 +337,7 @@ class OperatorTests(unittest.TestCase):
         )
 
         # Adding two graphs
-        g += [Graph.Full(3), Graph.Full(2)]
+        g += [self.k3, self.k2]
         self.assertTrue(
             g.vcount() == 16
             and g.ecount() == 14
@@ -308,7 +346,7 @@ class OperatorTests(unittest.TestCase):
         )
 
     def testAddition(self):
-        g0 = Graph.Full(3)
+        g0 = self.k3
 
         # Adding vertices
         g = g0 + 2
@@ -347,7 +385,7 @@ class OperatorTests(unittest.TestCase):
         g0 = g
 
         # Adding another graph
-        g = g0 + Graph.Full(3)
+        g = g0 + self.k3
         self.assertTrue(
             g.vcount() == 9
             and g.ecount() == 10
@@ -440,14 +478,14 @@ class OperatorTests(unittest.TestCase):
         self.assertTrue(g2.ecount() == g.ecount() - 1)
 
     def testContractVertices(self):
-        g = Graph.Full(4) + Graph.Full(4) + [(0, 5), (1, 4)]
+        g = Graph(8, TWO_K4_EDGES)
 
         g2 = g.copy()
         g2.contract_vertices([0, 1, 2, 3, 1, 0, 4, 5])
         self.assertEqual(g2.vcount(), 6)
         self.assertEqual(g2.ecount(), g.ecount())
-        self.assertEqual(
-            sorted(g2.get_edgelist()),
+        self.assertEdgelistEqual(
+            g2,
             [
                 (0, 0),
                 (0, 1),
@@ -470,25 +508,7 @@ class OperatorTests(unittest.TestCase):
         g2.contract_vertices([0, 1, 2, 3, 1, 0, 6, 7])
         self.assertEqual(g2.vcount(), 8)
         self.assertEqual(g2.ecount(), g.ecount())
-        self.assertEqual(
-            sorted(g2.get_edgelist()),
-            [
-                (0, 0),
-                (0, 1),
-                (0, 1),
-                (0, 2),
-                (0, 3),
-                (0, 6),
-                (0, 7),
-                (1, 1),
-                (1, 2),
-                (1, 3),
-                (1, 6),
-                (1, 7),
-                (2, 3),
-                (6, 7),
-            ],
-        )
+        self.assertEdgelistEqual(g2, CONTRACTED_TWO_K4_EDGES)
 
         g2 = Graph(10)
         g2.contract_vertices([0, 0, 1, 1, 2, 2, 3, 3, 4, 4])
@@ -497,30 +517,17 @@ class OperatorTests(unittest.TestCase):
 
     @unittest.skipIf(np is None, "test case depends on NumPy")
     def testContractVerticesWithNumPyIntegers(self):
-        g = Graph.Full(4) + Graph.Full(4) + [(0, 5), (1, 4)]
+        g = Graph(8, TWO_K4_EDGES)
         g2 = g.copy()
         g2.contract_vertices([np.int32(x) for x in [0, 1, 2, 3, 1, 0, 6, 7]])
         self.assertEqual(g2.vcount(), 8)
         self.assertEqual(g2.ecount(), g.ecount())
-        self.assertEqual(
-            sorted(g2.get_edgelist()),
-            [
-                (0, 0),
-                (0, 1),
-                (0, 1),
-                (0, 2),
-                (0, 3),
-                (0, 6),
-                (0, 7),
-                (1, 1),
-                (1, 2),
-                (1, 3),
-                (1, 6),
-                (1, 7),
-                (2, 3),
-                (6, 7),
-            ],
-        )
+        self.assertEdgelistEqual(g2, CONTRACTED_TWO_K4_EDGES)
+
+        for dtype in (np.int8, np.int32, np.int64):
+            g3 = g.copy()
+            g3.contract_vertices(np.array([0, 1, 2, 3, 1, 0, 6, 7], dtype=dtype))
+            self.assertEqual(g3.get_edgelist(), g2.get_edgelist())
 
     def testReverseEdges(self):
         g = Graph.Tree(10, 3, mode="out")
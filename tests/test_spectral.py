@@ -1,14 +1,34 @@
 # vim:set ts=4 sw=4 sts=4 et:
 import unittest
 
+from itertools import chain
+
 from igraph import Graph
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from scipy import sparse
+except ImportError:
+    sparse = None
+
 
 class SpectralTests(unittest.TestCase):
     def assertAlmostEqualMatrix(self, mat1, mat2, eps=1e-7):
-        self.assertTrue(
-            all(abs(obs - exp) < eps for obs, exp in zip(sum(mat1, []), sum(mat2, [])))
-        )
+        if np is not None:
+            np.testing.assert_allclose(
+                np.asarray(mat1, dtype=float),
+                np.asarray(mat2, dtype=float),
+                rtol=0,
+                atol=eps,
+            )
+            return
+
+        flat1, flat2 = chain.from_iterable(mat1), chain.from_iterable(mat2)
+        self.assertTrue(all(abs(obs - exp) < eps for obs, exp in zip(flat1, flat2)))
 
     def testLaplacian(self):
         g = Graph.Full(3)
@@ -94,6 +114,58 @@ class SpectralTests(unittest.TestCase):
             ],
         )
 
+    @unittest.skipIf(sparse is None, "test case depends on SciPy")
+    def testLaplacianSparse(self):
+        g = Graph.Full(3)
+        g.es["weight"] = [1, 2, 3]
+        for weights in (None, "weight"):
+            for normalized in (False, True, "left", "right"):
+                mat = g.get_laplacian_sparse(weights, normalized)
+                self.assertTrue(sparse.issparse(mat))
+                self.assertAlmostEqualMatrix(
+                    mat.toarray(), g.laplacian(weights, normalized)
+                )
+
+        # Isolated vertex, loop and multi-edge
+        g = Graph.Tree(5, 2)
+        g.add_vertices(1)
+        g.add_edges([(2, 2), (0, 1)])
+        mat = g.get_laplacian_sparse()
+        self.assertAlmostEqualMatrix(mat.toarray(), g.laplacian())
+
+        g = Graph.Formula("A --> B --> C --> D --> E --> A, A --> C")
+        for mode in ("out", "in", "all"):
+            mat = g.get_laplacian_sparse(mode=mode)
+            self.assertAlmostEqualMatrix(mat.toarray(), g.laplacian(mode=mode))
+        mat = g.get_laplacian_sparse(mode="out", normalized="left")
+        self.assertAlmostEqualMatrix(
+            mat.toarray(), g.laplacian(mode="out", normalized="left")
+        )
+        mat = g.get_laplacian_sparse(mode="in", normalized="right")
+        self.assertAlmostEqualMatrix(
+            mat.toarray(), g.laplacian(mode="in", normalized="right")
+        )
+
+        # String arguments are case-insensitive, like in laplacian()
+        mat = g.get_laplacian_sparse(mode="ALL", normalized="Symmetric")
+        self.assertAlmostEqualMatrix(
+            mat.toarray(), g.laplacian(mode="ALL", normalized="Symmetric")
+        )
+
+        # Weights given as an edge attribute name on a directed graph
+        g.es["weight"] = [1, 2, 3, 4, 5, 6]
+        mat = g.get_laplacian_sparse("weight", mode="out", normalized="left")
+        self.assertAlmostEqualMatrix(
+            mat.toarray(), g.laplacian("weight", mode="out", normalized="left")
+        )
+
+        g = Graph([(0, 1)], directed=True)
+        self.assertRaises(
+            ValueError, g.get_laplacian_sparse, mode="in", normalized="left"
+        )
+        self.assertRaises(ValueError, g.get_laplacian_sparse, weights=[-1])
+        self.assertRaises(ValueError, g.get_laplacian_sparse, normalized="spam")
+
 
 def suite():
     spectral_suite = unittest.defaultTestLoader.loadTestsFromTestCase(SpectralTests)
@@ -1,4 +1,4 @@
-import math
+import random
 import unittest
 import warnings
 
@@ -6,23 +6,49 @@ from igraph import Graph, InternalError, IN, OUT, ALL, TREE_IN
 from math import inf, isnan
 
 
-class SimplePropertiesTests(unittest.TestCase):
-    gfull = Graph.Full(10)
-    gempty = Graph(10)
-    g = Graph(4, [(0, 1), (0, 2), (1, 2), (0, 3), (1, 3)])
-    gdir = Graph(
-        4, [(0, 1), (0, 2), (1, 2), (2, 1), (0, 3), (1, 3), (3, 0)], directed=True
-    )
-    tree = Graph.Tree(14, 3)
+class AllAlmostEqualMixin:
+    def assertAllAlmostEqual(self, first, second, places=7):
+        """Asserts that two sequences of numbers have the same length and are
+        equal element by element when rounded to the given number of decimal
+        places, like assertAlmostEqual() does."""
+        if len(first) != len(second):
+            self.fail(
+                "%r != %r: lengths differ (%d != %d)"
+                % (first, second, len(first), len(second))
+            )
+        for index, (x, y) in enumerate(zip(first, second)):
+            if round(abs(x - y), places) != 0:
+                self.fail(
+                    "%r != %r within %d places: first difference at index %d "
+                    "(%r != %r)" % (first, second, places, index, x, y)
+                )
+
+
+class SimplePropertiesTests(unittest.TestCase, AllAlmostEqualMixin):
+    @classmethod
+    def setUpClass(cls):
+        cls.gfull = Graph.Full(10)
+        cls.gempty = Graph(10)
+        cls.g = Graph(4, [(0, 1), (0, 2), (1, 2), (0, 3), (1, 3)])
+        cls.gdir = Graph(
+            4, [(0, 1), (0, 2), (1, 2), (2, 1), (0, 3), (1, 3), (3, 0)], directed=True
+        )
+        cls.tree = Graph.Tree(14, 3)
+        # Two cliques of size 5 connected by a single edge
+        cls.two_cliques = Graph.Full(5) + Graph.Full(5) + [(0, 5)]
 
     def testDensity(self):
-        self.assertAlmostEqual(1.0, self.gfull.density(), places=5)
-        self.assertAlmostEqual(0.0, self.gempty.density(), places=5)
-        self.assertAlmostEqual(5 / 6, self.g.density(), places=5)
-        self.assertAlmostEqual(1 / 2, self.g.density(True), places=5)
-        self.assertAlmostEqual(7 / 12, self.gdir.density(), places=5)
-        self.assertAlmostEqual(7 / 16, self.gdir.density(True), places=5)
-        self.assertAlmostEqual(1 / 7, self.tree.density(), places=5)
+        observed = [
+            self.gfull.density(),
+            self.gempty.density(),
+            self.g.density(),
+            self.g.density(True),
+            self.gdir.density(),
+            self.gdir.density(True),
+            self.tree.density(),
+        ]
+        expected = [1.0, 0.0, 5 / 6, 1 / 2, 7 / 12, 7 / 16, 1 / 7]
+        self.assertAllAlmostEqual(observed, expected, places=5)
 
     def testMeanDegree(self):
         self.assertEqual(9.0, self.gfull.mean_degree())
@@ -32,26 +58,26 @@ class SimplePropertiesTests(unittest.TestCase):
         self.assertAlmostEqual(13 / 7, self.tree.mean_degree(), places=5)
 
     def testDiameter(self):
-        self.assertTrue(self.gfull.diameter() == 1)
-        self.assertTrue(self.gempty.diameter(unconn=False) == inf)
-        self.assertTrue(self.gempty.diameter(unconn=False) == inf)
-        self.assertTrue(self.g.diameter() == 2)
-        self.assertTrue(self.gdir.diameter(False) == 2)
-        self.assertTrue(self.gdir.diameter() == 3)
-        self.assertTrue(self.tree.diameter() == 5)
+        self.assertEqual(self.gfull.diameter(), 1)
+        self.assertEqual(self.gempty.diameter(unconn=False), inf)
+        self.assertEqual(self.gempty.diameter(unconn=False), inf)
+        self.assertEqual(self.g.diameter(), 2)
+        self.assertEqual(self.gdir.diameter(False), 2)
+        self.assertEqual(self.gdir.diameter(), 3)
+        self.assertEqual(self.tree.diameter(), 5)
 
         s, t, d = self.tree.farthest_points()
         self.assertTrue((s == 13 or t == 13) and d == 5)
-        self.assertTrue(self.gempty.farthest_points(unconn=False) == (None, None, inf))
+        self.assertEqual(self.gempty.farthest_points(unconn=False), (None, None, inf))
 
         d = self.tree.get_diameter()
         self.assertTrue(d[0] == 13 or d[-1] == 13)
 
         weights = [1, 1, 1, 5, 1, 5, 1, 1, 1, 1, 1, 1, 5]
-        self.assertTrue(self.tree.diameter(weights=weights) == 15)
+        self.assertEqual(self.tree.diameter(weights=weights), 15)
 
-        d = self.tree.farthest_points(weights=weights)
-        self.assertTrue(d == (13, 6, 15) or d == (6, 13, 15))
+        s, t, d = self.tree.farthest_points(weights=weights)
+        self.assertEqual((min(s, t), max(s, t), d), (6, 13, 15))
 
     def testEccentricity(self):
         self.assertEqual(self.gfull.eccentricity(), [1] * self.gfull.vcount())
@@ -91,17 +117,17 @@ class SimplePropertiesTests(unittest.TestCase):
         self.assertTrue(isnan(Graph().radius()))
 
     def testTransitivity(self):
-        self.assertTrue(self.gfull.transitivity_undirected() == 1.0)
-        self.assertTrue(self.tree.transitivity_undirected() == 0.0)
-        self.assertTrue(self.g.transitivity_undirected() == 0.75)
+        self.assertEqual(self.gfull.transitivity_undirected(), 1.0)
+        self.assertEqual(self.tree.transitivity_undirected(), 0.0)
+        self.assertEqual(self.g.transitivity_undirected(), 0.75)
 
     def testLocalTransitivity(self):
-        self.assertTrue(
-            self.gfull.transitivity_local_undirected() == [1.0] * self.gfull.vcount()
+        self.assertEqual(
+            self.gfull.transitivity_local_undirected(), [1.0] * self.gfull.vcount()
         )
-        self.assertTrue(
-            self.tree.transitivity_local_undirected(mode="zero")
-            == [0.0] * self.tree.vcount()
+        self.assertEqual(
+            self.tree.transitivity_local_undirected(mode="zero"),
+            [0.0] * self.tree.vcount(),
         )
 
         transitivity = self.g.transitivity_local_undirected(mode="zero")
@@ -117,15 +143,14 @@ class SimplePropertiesTests(unittest.TestCase):
         )
 
     def testAvgLocalTransitivity(self):
-        self.assertTrue(self.gfull.transitivity_avglocal_undirected() == 1.0)
-        self.assertTrue(self.tree.transitivity_avglocal_undirected() == 0.0)
+        self.assertEqual(self.gfull.transitivity_avglocal_undirected(), 1.0)
+        self.assertEqual(self.tree.transitivity_avglocal_undirected(), 0.0)
         self.assertAlmostEqual(
             self.g.transitivity_avglocal_undirected(), 5 / 6.0, places=4
         )
 
     def testModularity(self):
-        g = Graph.Full(5) + Graph.Full(5)
-        g.add_edges([(0, 5)])
+        g = self.two_cliques
         cl = [0] * 5 + [1] * 5
         self.assertAlmostEqual(g.modularity(cl), 0.4523, places=3)
         ws = [1] * 21
@@ -137,65 +162,65 @@ class SimplePropertiesTests(unittest.TestCase):
         self.assertRaises(InternalError, g.modularity, cl, ws[0:20])
 
 
-class DegreeTests(unittest.TestCase):
-    gfull = Graph.Full(10)
-    gempty = Graph(10)
-    g = Graph(4, [(0, 1), (0, 2), (1, 2), (0, 3), (1, 3), (0, 0)])
-    gdir = Graph(
-        4, [(0, 1), (0, 2), (1, 2), (2, 1), (0, 3), (1, 3), (3, 0)], directed=True
-    )
-    tree = Graph.Tree(10, 3)
+class DegreeTests(unittest.TestCase, AllAlmostEqualMixin):
+    @classmethod
+    def setUpClass(cls):
+        cls.gfull = Graph.Full(10)
+        cls.gempty = Graph(10)
+        cls.g = Graph(4, [(0, 1), (0, 2), (1, 2), (0, 3), (1, 3), (0, 0)])
+        cls.gdir = Graph(
+            4, [(0, 1), (0, 2), (1, 2), (2, 1), (0, 3), (1, 3), (3, 0)], directed=True
+        )
+        cls.tree = Graph.Tree(10, 3)
 
     def testKnn(self):
         knn, knnk = self.gfull.knn()
-        self.assertTrue(knn == [9.0] * 10)
+        self.assertEqual(knn, [9.0] * 10)
         self.assertAlmostEqual(knnk[8], 9.0, places=6)
 
         g = self.g.copy()
         g.simplify()
 
         knn, knnk = g.knn()
-        diff = max(abs(a - b) for a, b in zip(knn, [7 / 3.0, 7 / 3.0, 3, 3]))
-        self.assertAlmostEqual(diff, 0.0, places=6)
+        self.assertAllAlmostEqual(knn, [7 / 3.0, 7 / 3.0, 3, 3], places=6)
         self.assertEqual(len(knnk), 3)
         self.assertAlmostEqual(knnk[1], 3, places=6)
         self.assertAlmostEqual(knnk[2], 7 / 3.0, places=6)
 
     def testKnnNonSimple(self):
         knn, knnk = self.gfull.knn()
-        self.assertTrue(knn == [9.0] * 10)
+        self.assertEqual(knn, [9.0] * 10)
         self.assertAlmostEqual(knnk[8], 9.0, places=6)
 
         # knn works for non-simple graphs as well
         knn, knnk = self.g.knn()
-        diff = max(abs(a - b) for a, b in zip(knn, [17 / 5.0, 3, 4, 4]))
-        self.assertAlmostEqual(diff, 0.0, places=6)
+        self.assertAllAlmostEqual(knn, [17 / 5.0, 3, 4, 4], places=6)
         self.assertEqual(len(knnk), 5)
         self.assertAlmostEqual(knnk[1], 4, places=6)
         self.assertAlmostEqual(knnk[2], 3, places=6)
         self.assertAlmostEqual(knnk[4], 3.4, places=6)
 
     def testDegree(self):
-        self.assertTrue(self.gfull.degree() == [9] * 10)
-        self.assertTrue(self.gempty.degree() == [0] * 10)
-        self.assertTrue(self.g.degree(loops=False) == [3, 3, 2, 2])
-        self.assertTrue(self.g.degree() == [5, 3, 2, 2])
-        self.assertTrue(self.gdir.degree(mode=IN) == [1, 2, 2, 2])
-        self.assertTrue(self.gdir.degree(mode=OUT) == [3, 2, 1, 1])
-        self.assertTrue(self.gdir.degree(mode=ALL) == [4, 4, 3, 3])
+        self.assertEqual(self.gfull.degree(), [9] * 10)
+        self.assertEqual(self.gempty.degree(), [0] * 10)
+        self.assertEqual(self.g.degree(loops=False), [3, 3, 2, 2])
+        self.assertEqual(self.g.degree(), [5, 3, 2, 2])
+        self.assertEqual(self.gdir.degree(mode=IN), [1, 2, 2, 2])
+        self.assertEqual(self.gdir.degree(mode=OUT), [3, 2, 1, 1])
+        self.assertEqual(self.gdir.degree(mode=ALL), [4, 4, 3, 3])
         vs = self.gdir.vs.select(0, 2)
-        self.assertTrue(self.gdir.degree(vs, mode=ALL) == [4, 3])
-        self.assertTrue(self.gdir.degree(self.gdir.vs[1], mode=ALL) == 4)
+        self.assertEqual(self.gdir.degree(vs, mode=ALL), [4, 3])
+        self.assertEqual(self.gdir.degree(self.gdir.vs[1], mode=ALL), 4)
 
     def testMaxDegree(self):
-        self.assertTrue(self.gfull.maxdegree() == 9)
-        self.assertTrue(self.gempty.maxdegree() == 0)
-        self.assertTrue(self.g.maxdegree() == 3)
-        self.assertTrue(self.g.maxdegree(loops=True) == 5)
-        self.assertTrue(self.g.maxdegree([1, 2], loops=True) == 3)
-        self.assertTrue(self.gdir.maxdegree(mode=IN) == 2)
-        self.assertTrue(self.gdir.maxdegree(mode=OUT) == 3)
-        self.assertTrue(self.gdir.maxdegree(mode=ALL) == 4)
+        self.assertEqual(self.gfull.maxdegree(), 9)
+        self.assertEqual(self.gempty.maxdegree(), 0)
+        self.assertEqual(self.g.maxdegree(), 3)
+        self.assertEqual(self.g.maxdegree(loops=True), 5)
+        self.assertEqual(self.g.maxdegree([1, 2], loops=True), 3)
+        self.assertEqual(self.gdir.maxdegree(mode=IN), 2)
+        self.assertEqual(self.gdir.maxdegree(mode=OUT), 3)
+        self.assertEqual(self.gdir.maxdegree(mode=ALL), 4)
 
     def testStrength(self):
         # Turn off warnings about calling strength without weights
@@ -206,70 +231,79 @@ class DegreeTests(unittest.TestCase):
         )
 
         # No weights
-        self.assertTrue(self.gfull.strength() == [9] * 10)
-        self.assertTrue(self.gempty.strength() == [0] * 10)
-        self.assertTrue(self.g.degree(loops=False) == [3, 3, 2, 2])
-        self.assertTrue(self.g.degree() == [5, 3, 2, 2])
+        self.assertEqual(self.gfull.strength(), [9] * 10)
+        self.assertEqual(self.gempty.strength(), [0] * 10)
+        self.assertEqual(self.g.degree(loops=False), [3, 3, 2, 2])
+        self.assertEqual(self.g.degree(), [5, 3, 2, 2])
         # With weights
         ws = [1, 2, 3, 4, 5, 6]
-        self.assertTrue(self.g.strength(weights=ws, loops=False) == [7, 9, 5, 9])
-        self.assertTrue(self.g.strength(weights=ws) == [19, 9, 5, 9])
+        self.assertEqual(self.g.strength(weights=ws, loops=False), [7, 9, 5, 9])
+        self.assertEqual(self.g.strength(weights=ws), [19, 9, 5, 9])
         ws = [1, 2, 3, 4, 5, 6, 7]
-        self.assertTrue(self.gdir.strength(mode=IN, weights=ws) == [7, 5, 5, 11])
-        self.assertTrue(self.gdir.strength(mode=OUT, weights=ws) == [8, 9, 4, 7])
-        self.assertTrue(self.gdir.strength(mode=ALL, weights=ws) == [15, 14, 9, 18])
+        self.assertEqual(self.gdir.strength(mode=IN, weights=ws), [7, 5, 5, 11])
+        self.assertEqual(self.gdir.strength(mode=OUT, weights=ws), [8, 9, 4, 7])
+        self.assertEqual(self.gdir.strength(mode=ALL, weights=ws), [15, 14, 9, 18])
         vs = self.gdir.vs.select(0, 2)
-        self.assertTrue(self.gdir.strength(vs, mode=ALL, weights=ws) == [15, 9])
-        self.assertTrue(self.gdir.strength(self.gdir.vs[1], mode=ALL, weights=ws) == 14)
+        self.assertEqual(self.gdir.strength(vs, mode=ALL, weights=ws), [15, 9])
+        self.assertEqual(self.gdir.strength(self.gdir.vs[1], mode=ALL, weights=ws), 14)
 
 
 class LocalTransitivityTests(unittest.TestCase):
     def testLocalTransitivityFull(self):
         trans = Graph.Full(10).transitivity_local_undirected()
-        self.assertTrue(trans == [1.0] * 10)
+        self.assertEqual(trans, [1.0] * 10)
 
     def testLocalTransitivityTree(self):
         trans = Graph.Tree(10, 3).transitivity_local_undirected()
-        self.assertTrue(trans[0:3] == [0.0, 0.0, 0.0])
+        self.assertEqual(trans[0:3], [0.0, 0.0, 0.0])
 
     def testLocalTransitivityHalf(self):
         g = Graph(4, [(0, 1), (0, 2), (1, 2), (0, 3), (1, 3)])
         trans = g.transitivity_local_undirected()
         trans = [round(x, 3) for x in trans]
-        self.assertTrue(trans == [0.667, 0.667, 1.0, 1.0])
+        self.assertEqual(trans, [0.667, 0.667, 1.0, 1.0])
 
     def testLocalTransitivityPartial(self):
         g = Graph(4, [(0, 1), (0, 2), (1, 2), (0, 3), (1, 3)])
         trans = g.transitivity_local_undirected([1, 2])
         trans = [round(x, 3) for x in trans]
-        self.assertTrue(trans == [0.667, 1.0])
+        self.assertEqual(trans, [0.667, 1.0])
 
 
 class BiconnectedComponentTests(unittest.TestCase):
-    g1 = Graph.Full(10)
-    g2 = Graph(5, [(0, 1), (1, 2), (2, 3), (3, 4)])
-    g3 = Graph(6, [(0, 1), (1, 2), (2, 3), (3, 0), (2, 4), (2, 5), (4, 5)])
-    g4 = Graph.Full(2)
-    g5 = Graph.Full(1)
+    @classmethod
+    def setUpClass(cls):
+        cls.g1 = Graph.Full(10)
+        cls.g2 = Graph(5, [(0, 1), (1, 2), (2, 3), (3, 4)])
+        cls.g3 = Graph(6, [(0, 1), (1, 2), (2, 3), (3, 0), (2, 4), (2, 5), (4, 5)])
+        cls.g4 = Graph.Full(2)
+        cls.g5 = Graph.Full(1)
+
+    def assertComponentsEqual(self, components, expected):
+        """Asserts that the given components contain the same vertex sets as
+        the expected ones, ignoring the order of components and of vertices
+        within each component."""
+        self.assertEqual(len(components), len(expected))
+        self.assertEqual(set(map(frozenset, components)), set(map(frozenset, expected)))
 
     def testBiconnectedComponents(self):
         s = self.g1.biconnected_components()
-        self.assertTrue(len(s) == 1 and s[0] == list(range(10)))
+        self.assertComponentsEqual(s, [range(10)])
         s, ap = self.g1.biconnected_components(True)
-        self.assertTrue(len(s) == 1 and s[0] == list(range(10)))
+        self.assertComponentsEqual(s, [range(10)])
+        self.assertEqual(ap, [])
 
         s = self.g3.biconnected_components()
-        self.assertTrue(len(s) == 2 and s[0] == [2, 4, 5] and s[1] == [0, 1, 2, 3])
+        self.assertComponentsEqual(s, [[2, 4, 5], [0, 1, 2, 3]])
         s, ap = self.g3.biconnected_components(True)
-        self.assertTrue(
-            len(s) == 2 and s[0] == [2, 4, 5] and s[1] == [0, 1, 2, 3] and ap == [2]
-        )
+        self.assertComponentsEqual(s, [[2, 4, 5], [0, 1, 2, 3]])
+        self.assertEqual(ap, [2])
 
     def testArticulationPoints(self):
-        self.assertTrue(self.g1.articulation_points() == [])
-        self.assertTrue(self.g2.cut_vertices() == [1, 2, 3])
-        self.assertTrue(self.g3.articulation_points() == [2])
-        self.assertTrue(self.g4.articulation_points() == [])
+        self.assertEqual(self.g1.articulation_points(), [])
+        self.assertEqual(self.g2.cut_vertices(), [1, 2, 3])
+        self.assertEqual(self.g3.articulation_points(), [2])
+        self.assertEqual(self.g4.articulation_points(), [])
 
     def testIsBiconnected(self):
         self.assertTrue(self.g1.is_biconnected())
@@ -279,50 +313,63 @@ class BiconnectedComponentTests(unittest.TestCase):
         self.assertFalse(self.g5.is_biconnected())
 
 
-class CentralityTests(unittest.TestCase):
+class CentralityTests(unittest.TestCase, AllAlmostEqualMixin):
+    @classmethod
+    def setUpClass(cls):
+        # Shared by the authority and hub score tests
+        cls.in_tree = Graph.Tree(15, 2, TREE_IN)
+
+    def setUp(self):
+        # Closeness and harmonic centrality may emit RuntimeWarnings from the
+        # C core (e.g., with a cutoff); silence them for every test in this
+        # class instead of wrapping each call in catch_warnings()
+        warning_filter = warnings.catch_warnings()
+        warning_filter.__enter__()
+        self.addCleanup(warning_filter.__exit__, None, None, None)
+        warnings.simplefilter("ignore", RuntimeWarning)
+
     def testBetweennessCentrality(self):
         g = Graph.Star(5)
-        self.assertTrue(g.betweenness() == [6.0, 0.0, 0.0, 0.0, 0.0])
+        self.assertEqual(g.betweenness(), [6.0, 0.0, 0.0, 0.0, 0.0])
 
         g = Graph(5, [(0, 1), (0, 2), (0, 3), (1, 4)])
-        self.assertTrue(g.betweenness() == [5.0, 3.0, 0.0, 0.0, 0.0])
-        self.assertTrue(g.betweenness(cutoff=2) == [3.0, 1.0, 0.0, 0.0, 0.0])
-        self.assertTrue(g.betweenness(cutoff=1) == [0.0, 0.0, 0.0, 0.0, 0.0])
+        self.assertEqual(g.betweenness(), [5.0, 3.0, 0.0, 0.0, 0.0])
+        self.assertEqual(g.betweenness(cutoff=2), [3.0, 1.0, 0.0, 0.0, 0.0])
+        self.assertEqual(g.betweenness(cutoff=1), [0.0, 0.0, 0.0, 0.0, 0.0])
 
         g = Graph.Lattice([3, 3], circular=False)
-        self.assertTrue(
-            g.betweenness(cutoff=2) == [0.5, 2.0, 0.5, 2.0, 4.0, 2.0, 0.5, 2.0, 0.5]
+        self.assertEqual(
+            g.betweenness(cutoff=2), [0.5, 2.0, 0.5, 2.0, 4.0, 2.0, 0.5, 2.0, 0.5]
         )
 
         observed = g.betweenness(sources=[0, 8], targets=[0, 8])
         self.assertEqual(len(observed), g.vcount())
-        for x, y in zip(
+        self.assertAllAlmostEqual(
             observed, [0, 1 / 2, 1 / 6, 1 / 2, 2 / 3, 1 / 2, 1 / 6, 1 / 2, 0]
-        ):
-            self.assertAlmostEqual(x, y)
+        )
         self.assertRaises(
             ValueError, g.betweenness, cutoff=2, sources=[0, 8], targets=[0, 8]
         )
 
     def testEdgeBetweennessCentrality(self):
         g = Graph.Star(5)
-        self.assertTrue(g.edge_betweenness() == [4.0, 4.0, 4.0, 4.0])
+        self.assertEqual(g.edge_betweenness(), [4.0, 4.0, 4.0, 4.0])
 
         g = Graph(5, [(0, 1), (0, 2), (0, 3), (1, 4)])
-        self.assertTrue(g.edge_betweenness() == [6.0, 4.0, 4.0, 4.0])
-        self.assertTrue(g.edge_betweenness(cutoff=2) == [4.0, 3.0, 3.0, 2.0])
-        self.assertTrue(g.edge_betweenness(cutoff=1) == [1.0, 1.0, 1.0, 1.0])
+        self.assertEqual(g.edge_betweenness(), [6.0, 4.0, 4.0, 4.0])
+        self.assertEqual(g.edge_betweenness(cutoff=2), [4.0, 3.0, 3.0, 2.0])
+        self.assertEqual(g.edge_betweenness(cutoff=1), [1.0, 1.0, 1.0, 1.0])
 
         g = Graph.Ring(5)
-        self.assertTrue(g.edge_betweenness() == [3.0, 3.0, 3.0, 3.0, 3.0])
-        self.assertTrue(
-            g.edge_betweenness(weights=[4, 1, 1, 1, 1]) == [0.5, 3.5, 5.5, 5.5, 3.5]
+        self.assertEqual(g.edge_betweenness(), [3.0, 3.0, 3.0, 3.0, 3.0])
+        self.assertEqual(
+            g.edge_betweenness(weights=[4, 1, 1, 1, 1]), [0.5, 3.5, 5.5, 5.5, 3.5]
         )
 
         g = Graph.Lattice([3, 3], circular=False)
         observed = g.edge_betweenness(sources=[0, 8], targets=[0, 8])
         self.assertEqual(len(observed), g.ecount())
-        for x, y in zip(
+        self.assertAllAlmostEqual(
             observed,
             [
                 1 / 2,
@@ -338,8 +385,7 @@ class CentralityTests(unittest.TestCase):
                 1 / 6,
                 1 / 2,
             ],
-        ):
-            self.assertAlmostEqual(x, y)
+        )
         self.assertRaises(
             ValueError, g.edge_betweenness, cutoff=2, sources=[0, 8], targets=[0, 8]
         )
@@ -348,32 +394,21 @@ class CentralityTests(unittest.TestCase):
         g = Graph.Star(5)
         cl = g.closeness()
         cl2 = [1.0, 4 / 7.0, 4 / 7.0, 4 / 7.0, 4 / 7.0]
-        for idx in range(g.vcount()):
-            self.assertAlmostEqual(cl[idx], cl2[idx], places=3)
+        self.assertAllAlmostEqual(cl, cl2, places=3)
 
-        g = Graph.Star(5)
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore")
-            cl = g.closeness(cutoff=1.0)
+        cl = g.closeness(cutoff=1.0)
         cl2 = [1.0, 1.0, 1.0, 1.0, 1.0]
-        for idx in range(g.vcount()):
-            self.assertAlmostEqual(cl[idx], cl2[idx], places=3)
+        self.assertAllAlmostEqual(cl, cl2, places=3)
 
         weights = [1] * 4
 
-        g = Graph.Star(5)
         cl = g.closeness(weights=weights)
         cl2 = [1.0, 0.57142, 0.57142, 0.57142, 0.57142]
-        for idx in range(g.vcount()):
-            self.assertAlmostEqual(cl[idx], cl2[idx], places=3)
+        self.assertAllAlmostEqual(cl, cl2, places=3)
 
-        g = Graph.Star(5)
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore")
-            cl = g.closeness(cutoff=1.0, weights=weights)
+        cl = g.closeness(cutoff=1.0, weights=weights)
         cl2 = [1.0, 1.0, 1.0, 1.0, 1.0]
-        for idx in range(g.vcount()):
-            self.assertAlmostEqual(cl[idx], cl2[idx], places=3)
+        self.assertAllAlmostEqual(cl, cl2, places=3)
 
         # Test for igraph/igraph:#1078
         g = Graph(
@@ -422,9 +457,7 @@ class CentralityTests(unittest.TestCase):
             0.881304,
             0.64685,
         ]
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore")
-            cl = g.closeness(weights=weights)
+        cl = g.closeness(weights=weights)
         expected_cl = [
             1.63318,
             1.52014,
@@ -437,72 +470,60 @@ class CentralityTests(unittest.TestCase):
             1.3891,
             1.12829,
         ]
-        for obs, exp in zip(cl, expected_cl):
-            self.assertAlmostEqual(obs, exp, places=4)
+        self.assertAllAlmostEqual(cl, expected_cl, places=4)
 
     def testHarmonicCentrality(self):
         g = Graph.Star(5)
         cl = g.harmonic_centrality()
         cl2 = [1.0] + [(1.0 + 1 / 2 * 3) / 4] * 4
-        for idx in range(g.vcount()):
-            self.assertAlmostEqual(cl[idx], cl2[idx], places=3)
+        self.assertAllAlmostEqual(cl, cl2, places=3)
 
-        g = Graph.Star(5)
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore")
-            cl = g.harmonic_centrality(cutoff=1.0)
+        cl = g.harmonic_centrality(cutoff=1.0)
         cl2 = [1.0, 0.25, 0.25, 0.25, 0.25]
-        for idx in range(g.vcount()):
-            self.assertAlmostEqual(cl[idx], cl2[idx], places=3)
+        self.assertAllAlmostEqual(cl, cl2, places=3)
 
         weights = [1] * 4
 
-        g = Graph.Star(5)
         cl = g.harmonic_centrality(weights=weights)
         cl2 = [1.0] + [0.625] * 4
-        for idx in range(g.vcount()):
-            self.assertAlmostEqual(cl[idx], cl2[idx], places=3)
+        self.assertAllAlmostEqual(cl, cl2, places=3)
 
-        g = Graph.Star(5)
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore")
-            cl = g.harmonic_centrality(cutoff=1.0, weights=weights)
+        cl = g.harmonic_centrality(cutoff=1.0, weights=weights)
         cl2 = [1.0, 0.25, 0.25, 0.25, 0.25]
-        for idx in range(g.vcount()):
-            self.assertAlmostEqual(cl[idx], cl2[idx], places=3)
+        self.assertAllAlmostEqual(cl, cl2, places=3)
 
     def testPageRank(self):
         g = Graph.Star(11)
         cent = g.pagerank()
-        self.assertTrue(cent.index(max(cent)) == 0)
+        self.assertEqual(cent.index(max(cent)), 0)
         self.assertAlmostEqual(max(cent), 0.4668, places=3)
 
     def testPersonalizedPageRank(self):
         g = Graph.Star(11)
         self.assertRaises(InternalError, g.personalized_pagerank, reset=[0] * 11)
         cent = g.personalized_pagerank(reset=[0, 10] + [0] * 9, damping=0.5)
-        self.assertTrue(cent.index(max(cent)) == 1)
+        self.assertEqual(cent.index(max(cent)), 1)
         self.assertAlmostEqual(cent[0], 0.3333, places=3)
         self.assertAlmostEqual(cent[1], 0.5166, places=3)
         self.assertAlmostEqual(cent[2], 0.0166, places=3)
         cent2 = g.personalized_pagerank(reset_vertices=g.vs[1], damping=0.5)
-        self.assertTrue(max(abs(x - y) for x, y in zip(cent, cent2)) < 0.001)
+        self.assertAllAlmostEqual(cent, cent2, places=3)
 
     def testEigenvectorCentrality(self):
         g = Graph.Star(11)
         cent = g.evcent()
-        self.assertTrue(cent.index(max(cent)) == 0)
+        self.assertEqual(cent.index(max(cent)), 0)
         self.assertAlmostEqual(max(cent), 1.0, places=3)
         self.assertTrue(min(cent) >= 0)
         cent, ev = g.evcent(scale=False, return_eigenvalue=True)
         if cent[0] < 0:
             cent = [-x for x in cent]
-        self.assertTrue(cent.index(max(cent)) == 0)
+        self.assertEqual(cent.index(max(cent)), 0)
         self.assertAlmostEqual(cent[1] / cent[0], 0.3162, places=3)
         self.assertAlmostEqual(ev, 3.162, places=3)
 
     def testAuthorityScore(self):
-        g = Graph.Tree(15, 2, TREE_IN)
+        g = self.in_tree
         asc = g.authority_score()
         self.assertAlmostEqual(max(asc), 1.0, places=3)
 
@@ -510,7 +531,7 @@ class CentralityTests(unittest.TestCase):
         g.authority_score(scale=False, return_eigenvalue=True)
 
     def testHubScore(self):
-        g = Graph.Tree(15, 2, TREE_IN)
+        g = self.in_tree
         hsc = g.hub_score()
         self.assertAlmostEqual(max(hsc), 1.0, places=3)
 
@@ -523,11 +544,16 @@ class CentralityTests(unittest.TestCase):
 
 
 class NeighborhoodTests(unittest.TestCase):
+    def assertNeighborhoodsEqual(self, observed, expected):
+        """Asserts that the given neighborhoods contain the expected vertex
+        IDs; the order of vertices within a neighborhood is ignored."""
+        self.assertEqual([sorted(vertices) for vertices in observed], expected)
+
     def testNeighborhood(self):
         g = Graph.Ring(10, circular=False)
-        self.assertTrue(
-            list(map(sorted, g.neighborhood()))
-            == [
+        self.assertNeighborhoodsEqual(
+            g.neighborhood(),
+            [
                 [0, 1],
                 [0, 1, 2],
                 [1, 2, 3],
@@ -538,11 +564,11 @@ class NeighborhoodTests(unittest.TestCase):
                 [6, 7, 8],
                 [7, 8, 9],
                 [8, 9],
-            ]
+            ],
         )
-        self.assertTrue(
-            list(map(sorted, g.neighborhood(order=3)))
-            == [
+        self.assertNeighborhoodsEqual(
+            g.neighborhood(order=3),
+            [
                 [0, 1, 2, 3],
                 [0, 1, 2, 3, 4],
                 [0, 1, 2, 3, 4, 5],
@@ -553,11 +579,11 @@ class NeighborhoodTests(unittest.TestCase):
                 [4, 5, 6, 7, 8, 9],
                 [5, 6, 7, 8, 9],
                 [6, 7, 8, 9],
-            ]
+            ],
         )
-        self.assertTrue(
-            list(map(sorted, g.neighborhood(order=3, mindist=2)))
-            == [
+        self.assertNeighborhoodsEqual(
+            g.neighborhood(order=3, mindist=2),
+            [
                 [2, 3],
                 [3, 4],
                 [0, 4, 5],
@@ -568,39 +594,49 @@ class NeighborhoodTests(unittest.TestCase):
                 [4, 5, 9],
                 [5, 6],
                 [6, 7],
-            ]
+            ],
         )
 
     def testNeighborhoodSize(self):
         g = Graph.Ring(10, circular=False)
-        self.assertTrue(g.neighborhood_size() == [2, 3, 3, 3, 3, 3, 3, 3, 3, 2])
-        self.assertTrue(g.neighborhood_size(order=3) == [4, 5, 6, 7, 7, 7, 7, 6, 5, 4])
-        self.assertTrue(
-            g.neighborhood_size(order=3, mindist=2) == [2, 2, 3, 4, 4, 4, 4, 3, 2, 2]
+        self.assertEqual(g.neighborhood_size(), [2, 3, 3, 3, 3, 3, 3, 3, 3, 2])
+        self.assertEqual(g.neighborhood_size(order=3), [4, 5, 6, 7, 7, 7, 7, 6, 5, 4])
+        self.assertEqual(
+            g.neighborhood_size(order=3, mindist=2), [2, 2, 3, 4, 4, 4, 4, 3, 2, 2]
         )
 
 
 class MiscTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Graphs for the maximum cardinality search test; the random
+        # geometric graph is seeded so that failures can be reproduced
+        random.seed(42)
+        cls.grg = Graph.GRG(100, 0.2)
+        cls.petersen = Graph.Famous("petersen")
+
     def assert_valid_maximum_cardinality_search_result(self, graph, alpha, alpham1):
-        visited = []
         n = graph.vcount()
-        not_visited = list(range(n))
+        adjlist = graph.get_adjlist()
+        visited = [False] * n
 
-        # Check if alpham1 is a valid visiting order
+        # Number of visited neighbors of each vertex, updated as we go
+        visited_neis = [0] * n
+
+        # Check if alpham1 is a valid visiting order, i.e. each vertex has the
+        # largest number of visited neighbors among the unvisited vertices
         for vertex in reversed(alpham1):
-            neis = graph.neighbors(vertex)
-            visited_neis = sum(1 for v in neis if v in visited)
-            for other_vertex in not_visited:
-                neis = graph.neighbors(other_vertex)
-                other_visited_neis = sum(1 for v in neis if v in visited)
-                self.assertTrue(other_visited_neis <= visited_neis)
+            self.assertEqual(
+                max(count for count, seen in zip(visited_neis, visited) if not seen),
+                visited_neis[vertex],
+            )
 
-            visited.append(vertex)
-            not_visited.remove(vertex)
+            visited[vertex] = True
+            for neighbor in adjlist[vertex]:
+                visited_neis[neighbor] += 1
 
         # Check if alpha is the inverse of alpham1
-        for index, vertex in enumerate(alpham1):
-            self.assertEqual(alpha[vertex], index)
+        self.assertEqual([alpha[vertex] for vertex in alpham1], list(range(n)))
 
     def testBridges(self):
         g = Graph(5, [(0, 1), (1, 2), (2, 0), (0, 3), (3, 4)])
@@ -655,8 +691,8 @@ class MiscTests(unittest.TestCase):
 
     def testTopologicalSorting(self):
         g = Graph(5, [(0, 1), (0, 2), (1, 2), (1, 3), (2, 3)], directed=True)
-        self.assertTrue(g.topological_sorting() == [0, 4, 1, 2, 3])
-        self.assertTrue(g.topological_sorting(IN) == [3, 4, 2, 1, 0])
+        self.assertEqual(g.topological_sorting(), [0, 4, 1, 2, 3])
+        self.assertEqual(g.topological_sorting(IN), [3, 4, 2, 1, 0])
         g.to_undirected()
         self.assertRaises(InternalError, g.topological_sorting)
 
@@ -742,14 +778,14 @@ class MiscTests(unittest.TestCase):
         g = Graph(4, [(0, 1), (0, 2), (1, 2), (0, 3), (1, 3)])
         el = g.linegraph().get_edgelist()
         el.sort()
-        self.assertTrue(
-            el == [(0, 1), (0, 2), (0, 3), (0, 4), (1, 2), (1, 3), (2, 4), (3, 4)]
+        self.assertEqual(
+            el, [(0, 1), (0, 2), (0, 3), (0, 4), (1, 2), (1, 3), (2, 4), (3, 4)]
         )
 
         g = Graph(4, [(0, 1), (0, 2), (1, 2), (0, 3), (1, 3)], directed=True)
         el = g.linegraph().get_edgelist()
         el.sort()
-        self.assertTrue(el == [(0, 2), (0, 4)])
+        self.assertEqual(el, [(0, 2), (0, 4)])
 
     def testMaximumCardinalitySearch(self):
         g = Graph()
@@ -757,18 +793,25 @@ class MiscTests(unittest.TestCase):
         self.assertListEqual([], alpha)
         self.assertListEqual([], alpham1)
 
-        g = Graph.Famous("petersen")
+        g = self.petersen
         alpha, alpham1 = g.maximum_cardinality_search()
 
         self.assert_valid_maximum_cardinality_search_result(g, alpha, alpham1)
 
-        g = Graph.GRG(100, 0.2)
+        g = self.grg
         alpha, alpham1 = g.maximum_cardinality_search()
 
         self.assert_valid_maximum_cardinality_search_result(g, alpha, alpham1)
 
 
 class PathTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Lattices shared by the all-shortest-paths and k-shortest-paths
+        # tests; path queries do not modify the graphs
+        cls.lattice5 = Graph.Lattice([5, 5], circular=False)
+        cls.lattice100 = Graph.Lattice([100, 100], circular=False)
+
     def testDistances(self):
         g = Graph(
             10,
@@ -810,20 +853,17 @@ class PathTests(unittest.TestCase):
             [inf, inf, inf, inf, inf, inf, inf, inf, 0, 4],
             [inf, inf, inf, inf, inf, inf, inf, inf, inf, 0],
         ]
-        self.assertTrue(g.distances(weights=ws) == expected)
-        self.assertTrue(g.distances(weights="weight") == expected)
-        self.assertTrue(
-            g.distances(weights="weight", target=[2, 3])
-            == [row[2:4] for row in expected]
-        )
-        self.assertTrue(
-            g.distances(weights="weight", target=[2, 3], algorithm="bellman_ford")
-            == [row[2:4] for row in expected]
-        )
-        self.assertTrue(
-            g.distances(weights="weight", target=[2, 3], algorithm="johnson")
-            == [row[2:4] for row in expected]
-        )
+        self.assertEqual(g.distances(weights=ws), expected)
+        self.assertEqual(g.distances(weights="weight"), expected)
+
+        expected_to_2_3 = [row[2:4] for row in expected]
+        self.assertEqual(g.distances(weights="weight", target=[2, 3]), expected_to_2_3)
+        for algorithm in ("bellman_ford", "johnson"):
+            with self.subTest(algorithm=algorithm):
+                self.assertEqual(
+                    g.distances(weights="weight", target=[2, 3], algorithm=algorithm),
+                    expected_to_2_3,
+                )
         self.assertRaises(
             ValueError,
             g.distances,
@@ -855,13 +895,13 @@ class PathTests(unittest.TestCase):
         g = Graph(4, [(0, 1), (0, 2), (1, 3), (3, 2), (2, 1)], directed=True)
         sps = g.get_shortest_paths(0)
         expected = [[0], [0, 1], [0, 2], [0, 1, 3]]
-        self.assertTrue(sps == expected)
+        self.assertEqual(sps, expected)
         sps = g.get_shortest_paths(0, output="vpath")
         expected = [[0], [0, 1], [0, 2], [0, 1, 3]]
-        self.assertTrue(sps == expected)
+        self.assertEqual(sps, expected)
         sps = g.get_shortest_paths(0, output="epath")
         expected = [[], [0], [1], [0, 2]]
-        self.assertTrue(sps == expected)
+        self.assertEqual(sps, expected)
         self.assertRaises(ValueError, g.get_shortest_paths, 0, output="x")
 
     def testGetAllShortestPaths(self):
@@ -879,7 +919,7 @@ class PathTests(unittest.TestCase):
         expected = [[1, 2, 4], [1, 3, 4]]
         self.assertEqual(expected, sps)
 
-        g = Graph.Lattice([5, 5], circular=False)
+        g = self.lattice5
 
         sps = sorted(g.get_all_shortest_paths(0, 12))
         expected = [
@@ -892,7 +932,7 @@ class PathTests(unittest.TestCase):
         ]
         self.assertEqual(expected, sps)
 
-        g = Graph.Lattice([100, 100], circular=False)
+        g = self.lattice100
         sps = sorted(g.get_all_shortest_paths(0, 202))
         expected = [
             [0, 1, 2, 102, 202],
@@ -904,7 +944,6 @@ class PathTests(unittest.TestCase):
         ]
         self.assertEqual(expected, sps)
 
-        g = Graph.Lattice([100, 100], circular=False)
         sps = sorted(g.get_all_shortest_paths(0, [0, 202]))
         self.assertEqual([[0]] + expected, sps)
 
@@ -937,7 +976,7 @@ class PathTests(unittest.TestCase):
         expected = [[1, 2, 4], [1, 3, 4]]
         self.assertEqual(expected, sps)
 
-        g = Graph.Lattice([5, 5], circular=False)
+        g = self.lattice5
 
         sps = sorted(g.get_k_shortest_paths(0, 12, 6))
         expected = [
@@ -950,7 +989,7 @@ class PathTests(unittest.TestCase):
         ]
         self.assertEqual(expected, sps)
 
-        g = Graph.Lattice([100, 100], circular=False)
+        g = self.lattice100
         sps = sorted(g.get_k_shortest_paths(0, 202, 6))
         expected = [
             [0, 1, 2, 102, 202],
@@ -965,7 +1004,7 @@ class PathTests(unittest.TestCase):
         g = Graph([(0, 1), (1, 2), (0, 2)])
         g.es["weight"] = [0.5, 0.5, 1]
         sps = sorted(g.get_k_shortest_paths(0, 2, 2, weights="weight"))
-        self.assertEqual(sorted([[0, 2], [0, 1, 2]]), sorted(sps))
+        self.assertEqual([[0, 1, 2], [0, 2]], sps)
 
     def testGetAllSimplePaths(self):
         g = Graph.Ring(20)
@@ -993,33 +1032,32 @@ class PathTests(unittest.TestCase):
         )
 
         g = Graph.Lattice([4, 4], circular=False)
-        g = Graph([(min(u, v), max(u, v)) for u, v in g.get_edgelist()], directed=True)
+        g.to_directed(mode="acyclic")
+        edges = set(g.get_edgelist())
         sps = sorted(g.get_all_simple_paths(0, 15))
         self.assertEqual(20, len(sps))
         for path in sps:
             self.assertEqual(0, path[0])
             self.assertEqual(15, path[-1])
-            curr = path[0]
-            for next in path[1:]:
-                self.assertTrue(g.are_adjacent(curr, next))
-                curr = next
+            for edge in zip(path, path[1:]):
+                self.assertIn(edge, edges)
 
     def testPathLengthHist(self):
         g = Graph.Tree(15, 2)
         h = g.path_length_hist()
-        self.assertTrue(h.unconnected == 0)
-        self.assertTrue(
-            [(int(value), x) for value, _, x in h.bins()]
-            == [(1, 14), (2, 19), (3, 20), (4, 20), (5, 16), (6, 16)]
+        self.assertEqual(h.unconnected, 0)
+        self.assertEqual(
+            [(int(value), x) for value, _, x in h.bins()],
+            [(1, 14), (2, 19), (3, 20), (4, 20), (5, 16), (6, 16)],
         )
         g = Graph.Full(5) + Graph.Full(4)
         h = g.path_length_hist()
-        self.assertTrue(h.unconnected == 20)
+        self.assertEqual(h.unconnected, 20)
         g.to_directed()
         h = g.path_length_hist()
-        self.assertTrue(h.unconnected == 40)
+        self.assertEqual(h.unconnected, 40)
         h = g.path_length_hist(False)
-        self.assertTrue(h.unconnected == 20)
+        self.assertEqual(h.unconnected, 20)
 
     def testGetShortestPathsAStar(self):
         n = 4
@@ -1042,16 +1080,9 @@ class DominatorTests(unittest.TestCase):
         """
         Required due to NaN use for isolated nodes
         """
-        if len(alist) != len(blist):
-            return False
-        for _i, (a, b) in enumerate(zip(alist, blist)):
-            if math.isnan(a) and math.isnan(b):
-                continue
-            elif a == b:
-                continue
-            else:
-                return False
-        return True
+        return len(alist) == len(blist) and all(
+            a == b or (isnan(a) and isnan(b)) for a, b in zip(alist, blist)
+        )
 
     def testDominators(self):
         # examples taken from igraph's examples/simple/dominator_tree.out
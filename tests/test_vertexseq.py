@@ -13,6 +13,13 @@ except ImportError:
 
 
 class VertexTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Directed Petersen graph shared by the incidence and neighborhood
+        # tests; neither of them modifies the graph
+        cls.petersen = Graph.Famous("petersen")
+        cls.petersen.to_directed()
+
     def setUp(self):
         self.g = Graph.Full(10)
 
@@ -30,21 +37,26 @@ class VertexTests(unittest.TestCase):
 
     def testRichCompare(self):
         g2 = Graph.Full(10)
-        for i in range(self.g.vcount()):
-            for j in range(self.g.vcount()):
-                self.assertEqual(i == j, self.g.vs[i] == self.g.vs[j])
-                self.assertEqual(i != j, self.g.vs[i] != self.g.vs[j])
-                self.assertEqual(i < j, self.g.vs[i] < self.g.vs[j])
-                self.assertEqual(i > j, self.g.vs[i] > self.g.vs[j])
-                self.assertEqual(i <= j, self.g.vs[i] <= self.g.vs[j])
-                self.assertEqual(i >= j, self.g.vs[i] >= self.g.vs[j])
-                self.assertFalse(self.g.vs[i] == g2.vs[j])
-                self.assertFalse(self.g.vs[i] != g2.vs[j])
-                self.assertFalse(self.g.vs[i] < g2.vs[j])
-                self.assertFalse(self.g.vs[i] > g2.vs[j])
-                self.assertFalse(self.g.vs[i] <= g2.vs[j])
-                self.assertFalse(self.g.vs[i] >= g2.vs[j])
-                self.assertFalse(self.g.es[i] == self.g.vs[j])
+        vertices, other_vertices = list(self.g.vs), list(g2.vs)
+        edges = list(self.g.es)
+        for i, v in enumerate(vertices):
+            for j, (w, other) in enumerate(zip(vertices, other_vertices)):
+                self.assertEqual(
+                    (i == j, i != j, i < j, i > j, i <= j, i >= j),
+                    (v == w, v != w, v < w, v > w, v <= w, v >= w),
+                )
+                self.assertEqual(
+                    (False,) * 6,
+                    (
+                        v == other,
+                        v != other,
+                        v < other,
+                        v > other,
+                        v <= other,
+                        v >= other,
+                    ),
+                )
+                self.assertFalse(edges[i] == w)
 
     def testUpdateAttributes(self):
         v = self.g.vs[0]
@@ -70,8 +82,7 @@ class VertexTests(unittest.TestCase):
         self.assertRaises(ValueError, v.attributes)
 
     def testIncident(self):
-        g = Graph.Famous("petersen")
-        g.to_directed()
+        g = self.petersen
 
         method_table = {"all": "all_edges", "in": "in_edges", "out": "out_edges"}
 
@@ -79,17 +90,14 @@ class VertexTests(unittest.TestCase):
             vertex = g.vs[i]
             for mode, method_name in method_table.items():
                 method = getattr(vertex, method_name)
+                expected = g.incident(i, mode=mode)
                 self.assertEqual(
-                    g.incident(i, mode=mode),
-                    [edge.index for edge in vertex.incident(mode=mode)],
-                )
-                self.assertEqual(
-                    g.incident(i, mode=mode), [edge.index for edge in method()]
+                    expected, [edge.index for edge in vertex.incident(mode=mode)]
                 )
+                self.assertEqual(expected, [edge.index for edge in method()])
 
     def testNeighbors(self):
-        g = Graph.Famous("petersen")
-        g.to_directed()
+        g = self.petersen
 
         for i in range(g.vcount()):
             vertex = g.vs[i]
@@ -157,10 +165,16 @@ class VertexTests(unittest.TestCase):
 
 
 class VertexSeqTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Template graph; each test works on its own copy because several
+        # tests modify the vertex attributes
+        cls.template = Graph.Full(10)
+        cls.template.vs["test"] = list(range(10))
+        cls.template.vs["name"] = list("ABCDEFGHIJ")
+
     def setUp(self):
-        self.g = Graph.Full(10)
-        self.g.vs["test"] = list(range(10))
-        self.g.vs["name"] = list("ABCDEFGHIJ")
+        self.g = self.template.copy()
 
     def testCreation(self):
         self.assertTrue(len(VertexSeq(self.g)) == 10)
@@ -204,7 +218,7 @@ class VertexSeqTests(unittest.TestCase):
         self.assertEqual(ind, [vertex.index for vertex in self.g.vs[list(arr)]])
 
     def testPartialAttributeAssignment(self):
-        only_even = self.g.vs.select(lambda v: (v.index % 2 == 0))
+        only_even = self.g.vs.select(range(0, self.g.vcount(), 2))
         only_even["test"] = [0] * len(only_even)
         self.assertTrue(self.g.vs["test"] == [0, 1, 0, 3, 0, 5, 0, 7, 0, 9])
         only_even["test2"] = list(range(5))
@@ -223,7 +237,7 @@ class VertexSeqTests(unittest.TestCase):
         self.g.vs["test"] = "ABC"
         self.assertTrue(self.g.vs["test"] == ["ABC"] * 10)
 
-        only_even = self.g.vs.select(lambda v: (v.index % 2 == 0))
+        only_even = self.g.vs.select(range(0, self.g.vcount(), 2))
         only_even["test"] = ["D", "E"]
         self.assertTrue(
             self.g.vs["test"]
@@ -336,10 +350,10 @@ class VertexSeqTests(unittest.TestCase):
     def testGraphMethodProxying(self):
         g = Graph.Barabasi(100)
         vs = g.vs(1, 3, 5, 7, 9)
-        self.assertEqual(vs.degree(), g.degree(vs))
-        self.assertEqual(g.degree(vs), g.degree(vs.indices))
-        for v, d in zip(vs, vs.degree()):
-            self.assertEqual(v.degree(), d)
+        degrees = g.degree(vs.indices)
+        self.assertEqual(vs.degree(), degrees)
+        self.assertEqual(g.degree(vs), degrees)
+        self.assertEqual([v.degree() for v in vs], degrees)
 
     def testBug73(self):
         # This is a regression test for igraph/python-igraph#73
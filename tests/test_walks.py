@@ -5,26 +5,35 @@ from igraph import Graph, InternalError
 
 
 class RandomWalkTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Graphs shared by the tests; random walks do not modify them
+        random.seed(42)
+        cls.grg = Graph.GRG(100, 0.2)
+        cls.grg_weighted = cls.grg.copy()
+        cls.grg_weighted.es["weight"] = [1.0] * cls.grg_weighted.ecount()
+        cls.tree = Graph.Tree(121, 3, mode="out")
+
     def setUp(self):
         random.seed(42)
 
-    def validate_walk(self, g, walk, start, length, mode="out"):
+    def validate_walk(self, adjlist, walk, start, length):
         self.assertEqual(len(walk), length + 1)
 
         prev = None
         for vertex in walk:
             if prev is not None:
-                self.assertTrue(vertex in g.neighbors(prev, mode=mode))
+                self.assertTrue(vertex in adjlist[prev])
             else:
                 self.assertEqual(start, vertex)
             prev = vertex
 
-    def validate_edge_walk(self, g, walk, start, length, mode="out"):
+    def validate_edge_walk(self, edgelist, walk, start, length):
         self.assertEqual(len(walk), length)
 
         prev_vertices = None
         for edgeid in walk:
-            vertices = g.es[edgeid].tuple
+            vertices = edgelist[edgeid]
             if prev_vertices is not None:
                 self.assertTrue(
                     vertices[0] in prev_vertices or vertices[1] in prev_vertices
@@ -34,39 +43,43 @@ class RandomWalkTests(unittest.TestCase):
             prev_vertices = vertices
 
     def testRandomWalkUndirected(self):
-        g = Graph.GRG(100, 0.2)
+        g = self.grg
+        adjlist = g.get_adjlist()
         for _i in range(100):
             start = random.randint(0, g.vcount() - 1)
             length = random.randint(0, 10)
             walk = g.random_walk(start, length)
-            self.validate_walk(g, walk, start, length)
+            self.validate_walk(adjlist, walk, start, length)
 
     def testRandomWalkDirectedOut(self):
-        g = Graph.Tree(121, 3, mode="out")
+        g = self.tree
         mode = "out"
+        adjlist = g.get_adjlist(mode=mode)
         for _i in range(100):
             start = 0
             length = random.randint(0, 4)
             walk = g.random_walk(start, length, mode)
-            self.validate_walk(g, walk, start, length, mode)
+            self.validate_walk(adjlist, walk, start, length)
 
     def testRandomWalkDirectedIn(self):
-        g = Graph.Tree(121, 3, mode="out")
+        g = self.tree
         mode = "in"
+        adjlist = g.get_adjlist(mode=mode)
         for _i in range(100):
             start = random.randint(40, g.vcount() - 1)
             length = random.randint(0, 4)
             walk = g.random_walk(start, length, mode)
-            self.validate_walk(g, walk, start, length, mode)
+            self.validate_walk(adjlist, walk, start, length)
 
     def testRandomWalkDirectedAll(self):
-        g = Graph.Tree(121, 3, mode="out")
+        g = self.tree
         mode = "all"
+        adjlist = g.get_adjlist(mode=mode)
         for _i in range(100):
             start = random.randint(0, g.vcount() - 1)
             length = random.randint(0, 10)
             walk = g.random_walk(start, length, mode)
-            self.validate_walk(g, walk, start, length, mode)
+            self.validate_walk(adjlist, walk, start, length)
 
     def testRandomWalkStuck(self):
         g = Graph.Ring(10, circular=False, directed=True)
@@ -75,40 +88,44 @@ class RandomWalkTests(unittest.TestCase):
         self.assertRaises(InternalError, g.random_walk, 5, 20, stuck="error")
 
     def testRandomWalkUndirectedVertices(self):
-        g = Graph.GRG(100, 0.2)
+        g = self.grg
+        adjlist = g.get_adjlist()
         for _i in range(10):
             start = random.randint(0, g.vcount() - 1)
             length = random.randint(0, 10)
             walk = g.random_walk(start, length, return_type="vertices")
-            self.validate_walk(g, walk, start, length)
+            self.validate_walk(adjlist, walk, start, length)
 
     def testRandomWalkUndirectedEdges(self):
-        g = Graph.GRG(100, 0.2)
+        g = self.grg
+        edgelist = g.get_edgelist()
         for _i in range(10):
             start = random.randint(0, g.vcount() - 1)
             length = random.randint(0, 10)
             walk = g.random_walk(start, length, return_type="edges")
-            self.validate_edge_walk(g, walk, start, length)
+            self.validate_edge_walk(edgelist, walk, start, length)
 
     def testRandomWalkUndirectedBoth(self):
-        g = Graph.GRG(100, 0.2)
+        g = self.grg
+        adjlist = g.get_adjlist()
+        edgelist = g.get_edgelist()
         for _i in range(10):
             start = random.randint(0, g.vcount() - 1)
             length = random.randint(0, 10)
             walk_dic = g.random_walk(start, length, return_type="both")
             self.assertTrue("vertices" in walk_dic)
             self.assertTrue("edges" in walk_dic)
-            self.validate_edge_walk(g, walk_dic["edges"], start, length)
-            self.validate_walk(g, walk_dic["vertices"], start, length)
+            self.validate_edge_walk(edgelist, walk_dic["edges"], start, length)
+            self.validate_walk(adjlist, walk_dic["vertices"], start, length)
 
     def testRandomWalkUndirectedWeighted(self):
-        g = Graph.GRG(100, 0.2)
-        g.es["weight"] = [1.0 for i in range(g.ecount())]
+        g = self.grg_weighted
+        adjlist = g.get_adjlist()
         for _i in range(100):
             start = random.randint(0, g.vcount() - 1)
             length = random.randint(0, 10)
             walk = g.random_walk(start, length, weights="weight")
-            self.validate_walk(g, walk, start, length)
+            self.validate_walk(adjlist, walk, start, length)
 
 
 def suite():
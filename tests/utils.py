@@ -24,23 +24,20 @@ def overridden_configuration(key, value):
 
 @contextmanager
 def temporary_file(content=None, mode=None, binary=False):
-    tmpf, tmpfname = tempfile.mkstemp()
-    os.close(tmpf)
-
     if mode is None:
         if content is None:
             mode = "rb"
         else:
             mode = "wb"
 
-    tmpf = open(tmpfname, mode)
-    if content is not None:
-        if hasattr(content, "encode") and not binary:
-            tmpf.write(dedent(content).encode("utf8"))
-        else:
-            tmpf.write(content)
+    with tempfile.NamedTemporaryFile(mode=mode, delete=False) as tmpf:
+        tmpfname = tmpf.name
+        if content is not None:
+            if hasattr(content, "encode") and not binary:
+                tmpf.write(dedent(content).encode("utf8"))
+            else:
+                tmpf.write(content)
 
-    tmpf.close()
     yield tmpfname
     try:
         os.unlink(tmpfname)